@@ -1,17 +1,40 @@
 """Database configuration and session management."""
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from app.utils.settings import DATABASE_URL
+from app.utils.settings import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
 
-# Create async engine
-engine = create_async_engine(DATABASE_URL, echo=False)
+# Create async engine with an explicit pool: pre-ping drops dead connections
+# after DB restarts, recycle avoids stale connections behind NAT/firewalls.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    connect_args={
+        # Per-query JIT rarely pays off for short OLTP statements, and the
+        # application_name makes this service identifiable in pg_stat_activity.
+        "server_settings": {"jit": "off", "application_name": "vinatien"},
+        "timeout": 10,
+        "command_timeout": 60,
+    },
+)
 
-# Create session factory
+# Create session factory. autoflush=False avoids implicit flush round-trips on
+# read paths; writers must call session.flush()/commit() explicitly.
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
-    autoflush=True,
+    autoflush=False,
     autocommit=False
 )
 
@@ -20,6 +43,9 @@ async def get_session() -> AsyncSession:
     """
     Get database session dependency for FastAPI.
 
+    The context manager closes the session on exit, so no explicit close
+    is needed here.
+
     Yields:
         AsyncSession: Database session
     """
@@ -28,6 +54,4 @@ async def get_session() -> AsyncSession:
             yield session
         except Exception:
             await session.rollback()
-            raise
-        finally:
-            await session.close()
\ No newline at end of file
+            raise
\ No newline at end of file
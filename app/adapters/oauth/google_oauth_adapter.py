@@ -1,41 +1,76 @@
+import hashlib
+import threading
+import time
 from typing import Dict
 
+import jwt
+from cachetools import TTLCache
 from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
 from google.auth.transport.requests import Request as GoogleRequest
 from google.oauth2 import id_token as id_token_module
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
+import requests
 
 from app.types.exceptions import AuthenticationException
 from app.utils.settings import (
     GOOGLE_CLIENT_ID,
     GOOGLE_CLIENT_SECRET,
+    GOOGLE_ID_TOKEN_CACHE_MAXSIZE,
+    GOOGLE_ID_TOKEN_CACHE_TTL,
     GOOGLE_REDIRECT_URIS,
 )
 
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 GOOGLE_USERINFO_URL = "https://openidconnect.googleapis.com/v1/userinfo"
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+
+# Cache of verified ID token payloads, keyed by sha256 of the raw token (never
+# the token itself). Bounded + TTL'd so expired tokens never serve from cache.
+_id_token_cache: TTLCache = TTLCache(
+    maxsize=GOOGLE_ID_TOKEN_CACHE_MAXSIZE, ttl=GOOGLE_ID_TOKEN_CACHE_TTL
+)
+_id_token_cache_lock = threading.Lock()
+
+# OAuth client config is constant per deploy; build it once instead of
+# reallocating the dict (and re-validating scopes) on every login.
+_CLIENT_CONFIG = {
+    "web": {
+        "client_id": GOOGLE_CLIENT_ID,
+        "client_secret": GOOGLE_CLIENT_SECRET,
+        "auth_uri": "https://accounts.google.com/o/oauth2/v2/auth",
+        "token_uri": GOOGLE_TOKEN_URL,
+        "redirect_uris": GOOGLE_REDIRECT_URIS,
+    }
+}
+_SCOPES = (
+    "openid",
+    "https://www.googleapis.com/auth/userinfo.email",
+    "https://www.googleapis.com/auth/userinfo.profile",
+)
+
+# Shared adapter so userinfo calls reuse keep-alive connections to Google
+# across requests instead of paying a TLS handshake per login. The adapter
+# owns the urllib3 pool, so mounting it on per-user sessions shares the pool.
+_https_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=100, pool_block=False)
+
+# One transport for all token verifications: keeps the TLS connection to
+# Google's JWKS endpoint warm and lets google-auth cache the certs across
+# calls instead of rebuilding a Session per verification.
+_google_http = requests.Session()
+_google_http.mount("https://", _https_adapter)
+_google_request = GoogleRequest(session=_google_http)
 
 
 def exchange_code_for_credentials(
     code: str, code_verifier: str, redirect_uri: str
 ) -> Credentials:
     """Exchange authorization code for OAuth credentials using PKCE."""
+    # The Flow itself is stateful per exchange, so only the constants are shared.
     flow = Flow.from_client_config(
-        {
-            "web": {
-                "client_id": GOOGLE_CLIENT_ID,
-                "client_secret": GOOGLE_CLIENT_SECRET,
-                "auth_uri": "https://accounts.google.com/o/oauth2/v2/auth",
-                "token_uri": GOOGLE_TOKEN_URL,
-                "redirect_uris": GOOGLE_REDIRECT_URIS,
-            }
-        },
-        scopes=[
-            "openid",
-            "https://www.googleapis.com/auth/userinfo.email",
-            "https://www.googleapis.com/auth/userinfo.profile",
-        ],
+        _CLIENT_CONFIG,
+        scopes=list(_SCOPES),
         redirect_uri=redirect_uri,
     )
     flow.code_verifier = code_verifier
@@ -43,23 +78,58 @@ def exchange_code_for_credentials(
     return flow.credentials
 
 
+def warm_google_certs() -> None:
+    """Pre-fetch Google's signing certs so the first login after deploy
+    doesn't pay the cert round-trip. Best-effort: verification falls back to
+    fetching on demand if this fails."""
+    try:
+        _google_http.get(GOOGLE_CERTS_URL, timeout=5)
+    except requests.RequestException:
+        pass
+
+
 def verify_id_token(creds: Credentials) -> Dict[str, str]:
-    """Verify and decode Google ID token."""
+    """Verify and decode Google ID token, caching verified payloads briefly."""
+    cache_key = hashlib.sha256(creds.id_token.encode()).hexdigest()
+
+    with _id_token_cache_lock:
+        cached = _id_token_cache.get(cache_key)
+    if cached is not None and cached.get("exp", 0) > time.time():
+        return cached
+
+    # Cheap unverified pre-checks: reject wrong-audience, wrong-issuer or
+    # expired tokens before paying for RS256 signature verification.
+    try:
+        unverified = jwt.decode(creds.id_token, options={"verify_signature": False})
+    except jwt.PyJWTError:
+        raise AuthenticationException("Malformed ID token")
+    if unverified.get("aud") != GOOGLE_CLIENT_ID:
+        raise AuthenticationException("ID token audience mismatch")
+    if unverified.get("iss") not in ("accounts.google.com", "https://accounts.google.com"):
+        raise AuthenticationException("ID token issuer mismatch")
+    if unverified.get("exp", 0) < time.time():
+        raise AuthenticationException("ID token expired")
+
     payload = id_token_module.verify_oauth2_token(
         creds.id_token,
-        GoogleRequest(),
+        _google_request,
         GOOGLE_CLIENT_ID,
     )
 
     if payload.get("aud") != GOOGLE_CLIENT_ID:
         raise AuthenticationException("ID token audience mismatch")
 
+    # Only cache successfully verified tokens so bad tokens are always rechecked.
+    with _id_token_cache_lock:
+        _id_token_cache[cache_key] = payload
+
     return payload
 
 
 def fetch_full_profile(creds: Credentials) -> Dict[str, str]:
     """Fetch complete user profile from Google."""
     auth_sess = AuthorizedSession(creds)
+    auth_sess.mount("https://", _https_adapter)
     resp = auth_sess.get(GOOGLE_USERINFO_URL)
     resp.raise_for_status()
     return resp.json()
\ No newline at end of file
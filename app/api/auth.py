@@ -11,6 +11,23 @@ from app.utils.settings import ENVIRONMENT, REFRESH_TOKEN_EXPIRES_IN
 
 router = APIRouter()
 
+# The cookie attributes are constant per deploy, so the Set-Cookie header is
+# prebuilt as a bytes template; only the token value varies per request. This
+# skips SimpleCookie re-encoding inside Starlette's set_cookie. JWTs are
+# base64url, so the value never needs cookie quoting.
+_COOKIE_PREFIX = b"refresh_token="
+_COOKIE_SUFFIX = (
+    f"; HttpOnly; Max-Age={REFRESH_TOKEN_EXPIRES_IN}; Path=/; SameSite=lax"
+    + ("; Secure" if ENVIRONMENT == "production" else "")
+).encode()
+
+
+def _set_refresh_cookie(response: Response, token: str) -> None:
+    """Set the refresh token as an httpOnly cookie."""
+    response.raw_headers.append(
+        (b"set-cookie", _COOKIE_PREFIX + token.encode() + _COOKIE_SUFFIX)
+    )
+
 
 @router.post(
     "/register",
@@ -48,14 +65,7 @@ async def register(
     )
 
     # Set refresh token as httpOnly cookie
-    response.set_cookie(
-        key="refresh_token",
-        value=token_pair.refresh_token,
-        httponly=True,
-        secure=ENVIRONMENT == "production",
-        samesite="lax",
-        max_age=REFRESH_TOKEN_EXPIRES_IN
-    )
+    _set_refresh_cookie(response, token_pair.refresh_token)
     return AuthResponse(
         access_token=token_pair.access_token,
         token_type=token_pair.token_type
@@ -93,14 +103,7 @@ async def login(
     )
 
     # Set refresh token as httpOnly cookie
-    response.set_cookie(
-        key="refresh_token",
-        value=token_pair.refresh_token,
-        httponly=True,
-        secure=ENVIRONMENT == "production",
-        samesite="lax",
-        max_age=REFRESH_TOKEN_EXPIRES_IN
-    )
+    _set_refresh_cookie(response, token_pair.refresh_token)
 
     return AuthResponse(
         access_token=token_pair.access_token,
@@ -141,14 +144,7 @@ async def refresh_token(
     token_pair = await auth_service.refresh_tokens(session, refresh_token)
 
     # Set new refresh token as httpOnly cookie
-    response.set_cookie(
-        key="refresh_token",
-        value=token_pair.refresh_token,
-        httponly=True,
-        secure=ENVIRONMENT == "production",
-        samesite="lax",
-        max_age=REFRESH_TOKEN_EXPIRES_IN
-    )
+    _set_refresh_cookie(response, token_pair.refresh_token)
 
     return AuthResponse(
         access_token=token_pair.access_token,
@@ -113,12 +113,13 @@ async def link_bank_account(
 @router.get(
     "/{bank_account_id}/transactions",
     response_model=TransactionListResponse,
+    response_model_exclude_none=True,
     summary="Get transactions for bank account"
 )
 async def get_transactions(
     bank_account_id: int,
     limit: int = 100,
-    offset: int = 0,
+    cursor: str | None = None,
     session: AsyncSession = Depends(get_session),
     account: AccountRead = Depends(authorize_authenticated_account())
 ) -> TransactionListResponse:
@@ -128,7 +129,7 @@ async def get_transactions(
     Args:
         bank_account_id: Bank account ID
         limit: Maximum number of transactions to return
-        offset: Pagination offset
+        cursor: Opaque keyset cursor from the previous page's next_cursor
         session: Database session
         account: Authenticated user account
 
@@ -143,7 +144,7 @@ async def get_transactions(
         bank_account_id=bank_account_id,
         account_id=account.account_id,
         limit=limit,
-        offset=offset
+        cursor=cursor
     )
 
 
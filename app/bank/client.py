@@ -0,0 +1,102 @@
+"""Shared HTTP client for bank API calls.
+
+A fresh client per request pays TCP + TLS setup on every bank call.
+One long-lived client per app instance keeps connections alive across
+requests; anything request-specific (X-Request-ID, Consent-ID) is passed
+as per-call headers by the bank implementations instead of being mutated
+on the client.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+# Bound bank calls so a hung VPBank endpoint can't pin a request forever,
+# and cap the shared connection pool.
+BANK_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+BANK_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+
+# Transient upstream failures worth retrying; retries reuse the pooled
+# connection, so they don't pay a fresh TCP+TLS handshake.
+BANK_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+BANK_RETRY_TOTAL = 3
+BANK_RETRY_BACKOFF = 0.5  # seconds; doubles per attempt
+# Methods whose repeats cannot duplicate upstream state. POST stays out:
+# a payment initiation answered with a gateway 5xx may still have gone
+# through, and PISP payments have no dedup key to absorb a re-issue.
+BANK_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Retry transient upstream failures with exponential backoff.
+
+    Honors Retry-After on 429s. Only idempotent methods are retried on
+    5xx; non-idempotent calls (POST: payments, consents, mock deposits)
+    are retried solely on 429, which means the upstream rate limiter
+    rejected the request before it was processed.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(BANK_RETRY_TOTAL + 1):
+            response = await self._transport.handle_async_request(request)
+            if (
+                response.status_code not in BANK_RETRY_STATUSES
+                or attempt == BANK_RETRY_TOTAL
+            ):
+                return response
+            if (
+                request.method not in BANK_RETRY_METHODS
+                and response.status_code != 429
+            ):
+                # 5xx on a non-idempotent call: the upstream may have
+                # committed the write, so surface it instead of re-issuing.
+                return response
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = BANK_RETRY_BACKOFF * (2 ** attempt)
+            await response.aclose()
+            await asyncio.sleep(delay)
+        return response
+
+
+def build_bank_transport() -> httpx.AsyncBaseTransport:
+    """Retry-wrapped transport; shared by the app client and the scripts."""
+    return RetryTransport(
+        httpx.AsyncHTTPTransport(http2=True, limits=BANK_HTTP_LIMITS)
+    )
+
+# Static headers every bank call sends; nothing per-request lives here.
+BANK_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "TPP-Redirect-URI": "https://www.google.ch",
+    "PSU-IP-Address": "192.0.0.12",
+}
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_bank_client() -> httpx.AsyncClient:
+    """Return the process-wide bank HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            transport=build_bank_transport(),
+            timeout=BANK_HTTP_TIMEOUT,
+            headers=BANK_BASE_HEADERS,
+        )
+    return _client
+
+
+async def close_bank_client() -> None:
+    """Close the shared client; called from the app lifespan on shutdown."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
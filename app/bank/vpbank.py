@@ -1,10 +1,32 @@
-from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+import logging
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
-import requests
-from app.bank.base_bank import Bank
+import httpx
+import ijson
+import orjson
 from app.bank.utils import generate_request_id
 
+log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4)
+def _ymd(ordinal: int) -> str:
+    """Format a date ordinal as YYYY-MM-DD, cached since the same few dates repeat all day."""
+    return date.fromordinal(ordinal).isoformat()
+
+
+# Set to True to print a per-transaction breakdown during review. Printing
+# thousands of formatted lines dominates runtime on large sandbox responses,
+# so the detail dump is off by default and only the summary is printed.
+DEBUG_TRANSACTION_REVIEW = False
+
+# Constant portion of the consent payload; only validUntil changes per call.
+_CONSENT_BASE = {
+    "access": ["accounts", "balances", "transactions", "confirmationOfFunds"],
+    "recurringIndicator": True,
+    "frequencyPerDay": 4
+}
 
 # PISP Details (Static details for the recipient)
 CREDITOR_ACCOUNT_IBAN = "DE89370400440532013000"
@@ -13,185 +35,229 @@ PAYMENT_AMOUNT = "100.50"
 DEBIT_BIC = "VPBPLI22"
 
 
-class VPBank(Bank):
-    """Concrete implementation for the VPBank Berlin Group API."""
+class _AsyncStreamReader:
+    """Adapt an httpx streaming response to the async read() protocol ijson expects."""
+
+    def __init__(self, resp: httpx.Response):
+        self._chunks = resp.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect a bytes source; don't consume.
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+class VPBank:
+    """Concrete implementation for the VPBank Berlin Group API.
+
+    Structurally satisfies the ``Bank`` protocol. All methods are async and
+    expect an ``httpx.AsyncClient`` so slow bank round-trips never block the
+    event loop.
+    """
 
     BASE_URL = "https://developer.vpbank.com/psd2/berlin-group/v1"
 
+    def __init__(self, session: httpx.AsyncClient, consent_id: str | None = None):
+        self.session = session
+        self.consent_id = consent_id
+
+    def _headers(self, last_digit: str, with_consent: bool = True) -> dict:
+        """Build per-request headers.
+
+        Headers are passed per call rather than mutated on the session so a
+        single shared client can serve concurrent requests safely.
+        """
+        headers = {"X-Request-ID": generate_request_id(last_digit)}
+        if with_consent and self.consent_id:
+            headers["Consent-ID"] = self.consent_id
+        return headers
+
     # --- AISP & Cleanup Methods (From user context, kept for completeness) ---
 
-    def create_consent_and_get_iban(self) -> str:
+    async def create_consent_and_get_iban(self) -> str:
         """Creates consent and extracts the working IBAN (target_account_id)."""
-        print("1. Creating Consent...")
-        self.session.headers.update({"X-Request-ID": generate_request_id('1')})
-        
+        return (await self.create_consent_and_list_ibans())[0]
+
+    async def create_consent_and_list_ibans(self) -> list[str]:
+        """Creates consent and returns every IBAN it grants access to."""
+        log.info("1. Creating Consent...")
+
         consent_payload = {
-            "access": ["accounts", "balances", "transactions", "confirmationOfFunds"],
-            "recurringIndicator": True,
-            "validUntil": (datetime.now() + timedelta(days=90)).strftime('%Y-%m-%d'),
-            "frequencyPerDay": 4
+            **_CONSENT_BASE,
+            "validUntil": _ymd(date.today().toordinal() + 90),
         }
-        
-        resp = self.session.post(f"{self.BASE_URL}/consents", json=consent_payload)
+
+        # orjson-serialized bytes skip httpx's stdlib json.dumps path; the
+        # Content-Type header is already set on the client.
+        resp = await self.session.post(
+            f"{self.BASE_URL}/consents",
+            content=orjson.dumps(consent_payload),
+            headers=self._headers('1', with_consent=False)
+        )
         resp.raise_for_status()
         consent_id = resp.json().get("consentId")
-        self.session.headers.update({"Consent-ID": consent_id})
-        print(f"✅ Consent ID: {consent_id}")
-
-        print(f"\n2. Finding Working IBAN via Consent Status Check...")
-        self.session.headers.update({"X-Request-ID": generate_request_id('2')})
-        resp = self.session.get(f"{self.BASE_URL}/consents/{consent_id}")
+        self.consent_id = consent_id
+        log.info("Consent ID: %s", consent_id)
+
+        log.info("2. Finding Working IBAN via Consent Status Check...")
+        resp = await self.session.get(
+            f"{self.BASE_URL}/consents/{consent_id}",
+            headers=self._headers('2')
+        )
         resp.raise_for_status()
 
         consent_data = resp.json()
-        print(f"DEBUG: Full consent response: {consent_data}")
 
         target_account_list = consent_data.get("access", {}).get("transactions", [])
         if not target_account_list:
             raise ValueError("CRITICAL FAILURE: Cannot find a working IBAN.")
 
-        print(f"DEBUG: Available accounts: {target_account_list}")
-
-        # Try to use the first account
-        target_account_id = target_account_list[0]
-        print(f"✅ Success! Discovered Target IBAN: {target_account_id}")
-        return target_account_id
+        log.debug("Available accounts: %s", target_account_list)
+        log.info("Discovered %d accessible IBAN(s); first: %s",
+                 len(target_account_list), target_account_list[0])
+        return target_account_list
 
-    def get_transaction_count(self, account_id: str) -> int:
+    async def get_transaction_count(self, account_id: str) -> int:
         """Fetches and counts current transactions."""
-        self.session.headers.update({"X-Request-ID": generate_request_id('9')})
-        date_from = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
-        date_to = datetime.now().strftime('%Y-%m-%d')
+        today = date.today().toordinal()
+        date_from = _ymd(today - 90)
+        date_to = _ymd(today)
         params = {"dateFrom": date_from, "dateTo": date_to, "bookingStatus": "all"}
         url = f"{self.BASE_URL}/accounts/{account_id}/transactions"
 
         try:
-            resp = self.session.get(url, params=params)
-            resp.raise_for_status()
-            tx_data = resp.json()
-            count = len(tx_data.get("booked", [])) + len(tx_data.get("pending", []))
+            # Stream-parse the response: count booked/pending entries as they
+            # arrive instead of buffering and materializing the full body.
+            count = 0
+            async with self.session.stream(
+                "GET", url, params=params, headers=self._headers('9')
+            ) as resp:
+                resp.raise_for_status()
+                async for prefix, event, _value in ijson.parse(_AsyncStreamReader(resp)):
+                    if event == "start_map" and prefix in ("booked.item", "pending.item"):
+                        count += 1
             return count
-        except requests.exceptions.HTTPError as e:
-            print(f"Warning: Could not fetch transaction count before deletion: {e}")
+        except httpx.HTTPStatusError as e:
+            log.warning("Could not fetch transaction count before deletion: %s", e)
             return -1
 
-    def get_transactions_and_review(self, account_id: str, step_name: str):
+    async def get_transactions_and_review(self, account_id: str, step_name: str):
             """Fetches all transactions and provides a detailed review."""
-            print(f"\n[{step_name}] Fetching ALL Transactions for {account_id}...")
-            self.session.headers.update({"X-Request-ID": generate_request_id('9')})
+            log.info("[%s] Fetching ALL Transactions for %s...", step_name, account_id)
 
-            date_from = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
-            date_to = datetime.now().strftime('%Y-%m-%d')
+            today = date.today().toordinal()
+            date_from = _ymd(today - 90)
+            date_to = _ymd(today)
 
             # Use 'all' to capture both pending (PISP) and booked (mock) transactions
             params = {"dateFrom": date_from, "dateTo": date_to, "bookingStatus": "all"}
             url = f"{self.BASE_URL}/accounts/{account_id}/transactions"
 
             try:
-                resp = self.session.get(url, params=params)
+                resp = await self.session.get(
+                    url, params=params, headers=self._headers('9')
+                )
                 resp.raise_for_status()
 
-                tx_data = resp.json()
+                # orjson decodes large transaction pages 2-5x faster than
+                # the stdlib parser behind resp.json()
+                tx_data = orjson.loads(resp.content)
                 booked = tx_data.get("booked", [])
                 pending = tx_data.get("pending", [])
 
-                print(f"✅ Success! Found {len(booked)} booked and {len(pending)} pending transactions.")
+                log.info("Found %d booked and %d pending transactions.", len(booked), len(pending))
 
                 all_transactions = booked + pending
 
                 if all_transactions:
-                    print("\n--- Review of Transactions (Incoming/Outgoing) ---")
-
-                    # Count the types of transactions
-                    incoming_count = 0
-                    outgoing_count = 0
-
-                    for tx in all_transactions:
-                        tx_amount = tx.get('transactionAmount', {})
-                        # Check if the transaction's debtor (sender) is YOUR account ID
-                        if tx.get('debtorAccount', {}).get('iban') == account_id:
-                            direction = "**OUTGOING PAYMENT (DEBIT)**"
-                            outgoing_count += 1
-                        else:
-                            direction = "INCOMING PAYMENT (CREDIT)"
-                            incoming_count += 1
-
-                        print(f"  > {direction}: {tx_amount.get('amount')} {tx_amount.get('currency')} (Date: {tx.get('bookingDate', 'N/A')})")
-
-                    print(f"\nSummary: {incoming_count} incoming (CREDIT), {outgoing_count} outgoing (DEBIT).")
+                    # Single pass over the list: a transaction is outgoing when
+                    # its debtor (sender) is this account.
+                    outgoing_count = sum(
+                        1 for tx in all_transactions
+                        if tx.get('debtorAccount', {}).get('iban') == account_id
+                    )
+                    incoming_count = len(all_transactions) - outgoing_count
+
+                    if DEBUG_TRANSACTION_REVIEW:
+                        log.debug("--- Review of Transactions (Incoming/Outgoing) ---")
+                        for tx in all_transactions:
+                            tx_amount = tx.get('transactionAmount', {})
+                            if tx.get('debtorAccount', {}).get('iban') == account_id:
+                                direction = "**OUTGOING PAYMENT (DEBIT)**"
+                            else:
+                                direction = "INCOMING PAYMENT (CREDIT)"
+                            log.debug("  > %s: %s %s (Date: %s)", direction, tx_amount.get('amount'), tx_amount.get('currency'), tx.get('bookingDate', 'N/A'))
+
+                    log.info("Summary: %d incoming (CREDIT), %d outgoing (DEBIT).", incoming_count, outgoing_count)
 
                 return True, tx_data
 
-            except requests.exceptions.HTTPError as e:
-                print(f"\n❌ FAILED at {step_name} (Transactions): {e}")
-                print(f"Response Body: {resp.text}")
+            except httpx.HTTPStatusError as e:
+                log.error("FAILED at %s (Transactions): %s; body: %s", step_name, e, e.response.text)
                 return False, None
 
-    def get_balance(self, account_id: str, step_name: str):
+    async def get_balance(self, account_id: str, step_name: str):
         """Fetches the balance for an account."""
-        print(f"\n[{step_name}] Fetching Balance for {account_id}...")
-        self.session.headers.update({"X-Request-ID": generate_request_id('4')})
+        log.info("[%s] Fetching Balance for %s...", step_name, account_id)
 
         url = f"{self.BASE_URL}/accounts/{account_id}/balances"
 
         try:
-            resp = self.session.get(url)
+            resp = await self.session.get(url, headers=self._headers('4'))
             resp.raise_for_status()
 
             balance_data = resp.json()
             # Extract the current balance amount
             current_balance = balance_data.get("balances", [{}])[0].get("balanceAmount", {})
 
-            print(f"✅ Success! Current Balance: {current_balance.get('amount')} {current_balance.get('currency')}")
+            log.info("Current Balance: %s %s", current_balance.get('amount'), current_balance.get('currency'))
             return True, current_balance
 
-        except requests.exceptions.HTTPError as e:
-            print(f"\n❌ FAILED at {step_name} (Balance): {e}")
-            print(f"Response Body: {resp.text}")
+        except httpx.HTTPStatusError as e:
+            log.error("FAILED at %s (Balance): %s; body: %s", step_name, e, e.response.text)
             return False, None
 
-    def delete_all_transactions(self, account_id: str) -> bool:
+    async def delete_all_transactions(self, account_id: str) -> bool:
         """
-        Attempts to delete ALL transactions for the given mock account using 
+        Attempts to delete ALL transactions for the given mock account using
         a non-standard sandbox cleanup endpoint.
         """
-        print(f"\n3. Attempting to DELETE ALL transactions for {account_id}...")
-        
+        log.info("3. Attempting to DELETE ALL transactions for %s...", account_id)
+
         # Sandbox cleanup pattern
         delete_url = f"{self.BASE_URL}/sandbox/accounts/{account_id}/transactions"
-        
-        self.session.headers.update({"X-Request-ID": generate_request_id('5')}) 
-        if "Consent-ID" in self.session.headers:
-            del self.session.headers["Consent-ID"]
 
         try:
-            resp = self.session.delete(delete_url)
-            
+            # Consent-ID must NOT be sent for this non-standard call.
+            resp = await self.session.delete(
+                delete_url, headers=self._headers('5', with_consent=False)
+            )
+
             if resp.status_code == 200 or resp.status_code == 204:
-                print(f"✅ SUCCESS! Sandbox cleanup request accepted (Status: {resp.status_code}).")
+                log.info("Sandbox cleanup request accepted (Status: %d).", resp.status_code)
                 return True
             elif resp.status_code == 404:
-                print(f"❌ FAILED (Status: 404 Not Found). The sandbox does not use the expected cleanup endpoint: {delete_url}")
+                log.warning("FAILED (404): the sandbox does not use the expected cleanup endpoint: %s", delete_url)
                 return False
             else:
                 resp.raise_for_status()
-                
-        except requests.exceptions.HTTPError as e:
-            print(f"❌ FAILED to delete transactions: {e}")
-            print("Response Body:", resp.text)
+
+        except httpx.HTTPStatusError as e:
+            log.error("FAILED to delete transactions: %s; body: %s", e, e.response.text)
             return False
 
     # --- PISP Methods (Implemented) ---
 
-    def make_payment(self, debtor_iban: str, amount: str, creditor_iban: str = CREDITOR_ACCOUNT_IBAN, creditor_bic: str = CREDITOR_BIC) -> str:
+    async def make_payment(self, debtor_iban: str, amount: str, creditor_iban: str = CREDITOR_ACCOUNT_IBAN, creditor_bic: str = CREDITOR_BIC) -> str:
         """
         Initiates a SEPA Credit Transfer payment (PISP) and returns the payment ID.
         Uses static defaults for the creditor for sandbox convenience.
         """
-        print("\n[PISP] 4. Initiating SEPA Credit Transfer Payment...")
-
-        payment_request_id = generate_request_id('8')  # '8' for mock success status
-        self.session.headers.update({"X-Request-ID": payment_request_id})
+        log.info("[PISP] 4. Initiating SEPA Credit Transfer Payment...")
 
         payment_payload = {
             # Debtor IBAN uses the discovered target_account_id
@@ -200,80 +266,81 @@ class VPBank(Bank):
             "creditorAccount": {"iban": creditor_iban, "bic": creditor_bic},
             "creditorName": "Test Recipient GmbH",
             "remittanceInformationUnstructured": "Payment for services rendered",
-            "requestedExecutionDate": (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+            "requestedExecutionDate": _ymd(date.today().toordinal() + 1)
         }
 
         url_init = f"{self.BASE_URL}/payments/sepa-credit-transfers"
 
-        resp = self.session.post(url_init, json=payment_payload)
+        # '8' for mock success status
+        resp = await self.session.post(
+            url_init, json=payment_payload, headers=self._headers('8')
+        )
         resp.raise_for_status()
 
         payment_data = resp.json()
         payment_id = payment_data.get("paymentId")
 
-        print(f"✅ Success! Payment ID Created: {payment_id}")
+        log.info("Payment ID Created: %s", payment_id)
         return payment_id
-    
-    def create_mock_deposit(self, account_id: str, amount: str) -> bool:
+
+    async def create_mock_deposit(self, account_id: str, amount: str) -> bool:
         """
-        Attempts to create a mock credit/deposit transaction on the account 
+        Attempts to create a mock credit/deposit transaction on the account
         using a common, NON-STANDARD sandbox endpoint.
         """
-        print(f"\n4. Attempting to CREATE MOCK DEPOSIT of EUR {amount} for {account_id}...")
-        
+        log.info("4. Attempting to CREATE MOCK DEPOSIT of EUR %s for %s...", amount, account_id)
+
         # NOTE: This endpoint is an *educated guess* based on common sandbox patterns.
-        deposit_url = f"{self.BASE_URL}/sandbox/accounts/{account_id}/transactions" 
-        
+        deposit_url = f"{self.BASE_URL}/sandbox/accounts/{account_id}/transactions"
+
         # Payload for an incoming Credit transaction
+        today_str = _ymd(date.today().toordinal())
         mock_transaction_payload = {
             "transactionAmount": {"currency": "EUR", "amount": amount},
-            "bookingDate": datetime.now().strftime('%Y-%m-%d'),
-            "valueDate": datetime.now().strftime('%Y-%m-%d'),
+            "bookingDate": today_str,
+            "valueDate": today_str,
             "creditorAccount": {"iban": account_id}, # Target is the Creditor
             "debtorName": "MockDeposit Source",
             "debtorAccount": {"iban": "DE99111111112222222233"},
             "remittanceInformationUnstructured": "Sandbox Deposit"
         }
-        
-        # Must ensure Consent-ID is NOT sent for this non-standard call.
-        if "Consent-ID" in self.session.headers:
-            del self.session.headers["Consent-ID"]
-            
-        self.session.headers.update({"X-Request-ID": generate_request_id('6')})
 
         try:
-            # We use POST assuming it creates a new mock transaction resource
-            resp = self.session.post(deposit_url, json=mock_transaction_payload)
-            
+            # We use POST assuming it creates a new mock transaction resource.
+            # Consent-ID must NOT be sent for this non-standard call.
+            resp = await self.session.post(
+                deposit_url,
+                json=mock_transaction_payload,
+                headers=self._headers('6', with_consent=False)
+            )
+
             if resp.status_code == 201:
-                print(f"✅ SUCCESS! Mock deposit request accepted (Status: {resp.status_code}).")
+                log.info("Mock deposit request accepted (Status: %d).", resp.status_code)
                 return True
             elif resp.status_code == 404:
-                print(f"❌ FAILED (Status: 404 Not Found). The sandbox does not use the expected mock deposit endpoint: {deposit_url}")
+                log.warning("FAILED (404): the sandbox does not use the expected mock deposit endpoint: %s", deposit_url)
                 return False
             else:
                 resp.raise_for_status()
-                
-        except requests.exceptions.HTTPError as e:
-            print(f"❌ FAILED to create mock deposit: {e}")
-            print("Response Body:", resp.text)
+
+        except httpx.HTTPStatusError as e:
+            log.error("FAILED to create mock deposit: %s; body: %s", e, e.response.text)
             return False
-    
-    def check_payment_status(self, payment_id: str) -> str:
+
+    async def check_payment_status(self, payment_id: str) -> str:
         """
         Checks the transaction status of a previously initiated payment.
         """
-        print(f"\n[PISP] 5. Fetching Payment Status for {payment_id}...")
+        log.info("[PISP] 5. Fetching Payment Status for %s...", payment_id)
 
-        self.session.headers.update({"X-Request-ID": generate_request_id('2')})
         # Use the proven SHORTENED URL path for status check
         status_url = f"{self.BASE_URL}/payments/{payment_id}/status"
 
-        resp = self.session.get(status_url)
+        resp = await self.session.get(status_url, headers=self._headers('2'))
         resp.raise_for_status()
 
         status_data = resp.json()
         final_status = status_data.get("transactionStatus")
 
-        print(f"🎉 PISP Status Check Complete. Status: {final_status} 🎉")
-        return final_status
\ No newline at end of file
+        log.info("PISP Status Check Complete. Status: %s", final_status)
+        return final_status
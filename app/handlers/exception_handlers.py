@@ -4,10 +4,10 @@ from fastapi.responses import JSONResponse
 from app.types.exceptions import (
     AuthenticationException,
     AuthorizationException,
+    BankApiException,
     BusinessRuleException,
     ConflictException,
     NotFoundException,
-    ResourceNotFound,
 )
 
 
@@ -16,13 +16,21 @@ def set_up_exception_handler(app):
     async def handle_business_error(_: Request, exc: BusinessRuleException):
         return JSONResponse(status_code=400, content={"detail": str(exc)})
 
+    @app.exception_handler(BankApiException)
+    async def handle_bank_api_error(_: Request, exc: BankApiException):
+        return JSONResponse(
+            status_code=502,
+            content={"detail": exc.error_code, "upstream_status": exc.upstream_status},
+        )
+
     @app.exception_handler(ConflictException)
     async def handle_conflict(_: Request, exc: ConflictException):
         return JSONResponse(status_code=409, content={"detail": str(exc)})
 
+    # ResourceNotFound is an alias of NotFoundException, so one
+    # registration covers both names
     @app.exception_handler(NotFoundException)
-    @app.exception_handler(ResourceNotFound)
-    async def handle_not_found(_: Request, exc: Exception):
+    async def handle_not_found(_: Request, exc: NotFoundException):
         return JSONResponse(status_code=404, content={"detail": str(exc)})
 
     @app.exception_handler(AuthenticationException)
@@ -1,10 +1,43 @@
 """Account repository for data access operations."""
 
+import re
+import threading
 from typing import Optional
-from sqlalchemy import select
+
+from cachetools import TTLCache
+from sqlalchemy import bindparam, delete, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from models.account_model import Account
+from app.utils.settings import ACCOUNT_CACHE_MAXSIZE, ACCOUNT_CACHE_TTL
+
+# Short-lived cache of accounts by email for the OAuth login hot path.
+# Only the *_cached wrappers consult it; password login and anything that
+# must see fresh is_active state keeps using the direct lookups. Entries
+# hold detached rows, which is safe for attribute reads since sessions
+# run with expire_on_commit=False.
+_account_email_cache: TTLCache = TTLCache(
+    maxsize=ACCOUNT_CACHE_MAXSIZE, ttl=ACCOUNT_CACHE_TTL or 1
+)
+_account_email_cache_lock = threading.Lock()
+
+# Statements for hot lookups are built once at import time so each call
+# reuses the same object (and its compiled-cache entry) instead of
+# reconstructing the select per call.
+_ACCOUNT_BY_EMAIL_STMT = select(Account).where(Account.email == bindparam("email"))
+_ACCOUNT_BY_USERNAME_STMT = select(Account).where(
+    Account.username == bindparam("username")
+)
+_ACCOUNT_EXISTS_STMT = (
+    select(literal(1))
+    .where(
+        (Account.username == bindparam("username")) |
+        (Account.email == bindparam("email"))
+    )
+    .limit(1)
+)
 
 
 async def get_account_by_id(session: AsyncSession, account_id: int) -> Optional[Account]:
@@ -18,8 +51,32 @@ async def get_account_by_id(session: AsyncSession, account_id: int) -> Optional[
     Returns:
         Account model or None if not found
     """
+    # session.get() hits the identity map within a request and reuses the
+    # cached compiled PK statement.
+    return await session.get(Account, account_id)
+
+
+async def get_account_lite(session: AsyncSession, account_id: int) -> Optional[Account]:
+    """
+    Retrieve account by ID with only the columns the auth path needs.
+
+    Skips hydrating heavyweight columns like password_hash, which the
+    authorization dependency never reads.
+
+    Args:
+        session: Database session
+        account_id: Account ID to retrieve
+
+    Returns:
+        Account model (partially loaded) or None if not found
+    """
     result = await session.execute(
-        select(Account).where(Account.id == account_id)
+        select(Account)
+        .options(load_only(
+            Account.id, Account.email, Account.username,
+            Account.full_name, Account.is_active, Account.created_at
+        ))
+        .where(Account.id == account_id)
     )
     return result.scalar_one_or_none()
 
@@ -35,12 +92,45 @@ async def get_account_by_email(session: AsyncSession, email: str) -> Optional[Ac
     Returns:
         Account model or None if not found
     """
-    result = await session.execute(
-        select(Account).where(Account.email == email)
-    )
+    result = await session.execute(_ACCOUNT_BY_EMAIL_STMT, {"email": email})
     return result.scalar_one_or_none()
 
 
+async def get_account_by_email_cached(session: AsyncSession, email: str) -> Optional[Account]:
+    """
+    Retrieve account by email, serving repeat lookups from a short TTL cache.
+
+    Intended for the OAuth login path where the same user re-authenticates
+    often; misses (no such account) are never cached.
+
+    Args:
+        session: Database session
+        email: Account email to search for
+
+    Returns:
+        Account model or None if not found
+    """
+    if ACCOUNT_CACHE_TTL <= 0:
+        return await get_account_by_email(session, email)
+
+    with _account_email_cache_lock:
+        account = _account_email_cache.get(email)
+    if account is not None:
+        return account
+
+    account = await get_account_by_email(session, email)
+    if account is not None:
+        with _account_email_cache_lock:
+            _account_email_cache[email] = account
+    return account
+
+
+def invalidate_account_cache(email: str) -> None:
+    """Drop a cached account after a write so later reads see fresh state."""
+    with _account_email_cache_lock:
+        _account_email_cache.pop(email, None)
+
+
 async def get_account_by_username(session: AsyncSession, username: str) -> Optional[Account]:
     """
     Retrieve account by username.
@@ -53,11 +143,33 @@ async def get_account_by_username(session: AsyncSession, username: str) -> Optio
         Account model or None if not found
     """
     result = await session.execute(
-        select(Account).where(Account.username == username)
+        _ACCOUNT_BY_USERNAME_STMT, {"username": username}
     )
     return result.scalar_one_or_none()
 
 
+async def get_usernames_matching_prefix(session: AsyncSession, prefix: str) -> set:
+    """
+    Retrieve all usernames that are the prefix or the prefix plus digits.
+
+    Lets callers compute a free numeric suffix in one round-trip instead
+    of probing candidate usernames one SELECT at a time.
+
+    Args:
+        session: Database session
+        prefix: Base username to match against
+
+    Returns:
+        Set of taken usernames matching the pattern
+    """
+    result = await session.execute(
+        select(Account.username).where(
+            Account.username.op("~")(f"^{re.escape(prefix)}[0-9]*$")
+        )
+    )
+    return set(result.scalars().all())
+
+
 async def create_account(session: AsyncSession, account: Account) -> Account:
     """
     Create a new account.
@@ -70,8 +182,9 @@ async def create_account(session: AsyncSession, account: Account) -> Account:
         Created account model
     """
     session.add(account)
+    # Server defaults (PK, created_at) come back via the INSERT's RETURNING
+    # during flush, so no post-commit refresh round-trip is needed.
     await session.commit()
-    await session.refresh(account)
     return account
 
 
@@ -86,8 +199,10 @@ async def update_account(session: AsyncSession, account: Account) -> Account:
     Returns:
         Updated account model
     """
+    # expire_on_commit=False keeps attributes live after commit, so the
+    # old post-commit refresh was a pure extra SELECT.
     await session.commit()
-    await session.refresh(account)
+    invalidate_account_cache(account.email)
     return account
 
 
@@ -103,15 +218,18 @@ async def delete_account(session: AsyncSession, account_id: int) -> bool:
         True if account was deleted, False if not found
     """
     result = await session.execute(
-        select(Account).where(Account.id == account_id)
+        delete(Account)
+        .where(Account.id == account_id)
+        .returning(Account.id)
     )
-    account = result.scalar_one_or_none()
-
-    if account:
-        await session.delete(account)
-        await session.commit()
-        return True
-    return False
+    deleted = result.scalar_one_or_none() is not None
+    await session.commit()
+    # Only the id is known here; evict any cached entry for this account.
+    with _account_email_cache_lock:
+        for email, cached in list(_account_email_cache.items()):
+            if cached.id == account_id:
+                _account_email_cache.pop(email, None)
+    return deleted
 
 
 async def account_exists_by_username_or_email(session: AsyncSession, username: str, email: str) -> bool:
@@ -127,18 +245,19 @@ async def account_exists_by_username_or_email(session: AsyncSession, username: s
         True if account exists, False otherwise
     """
     result = await session.execute(
-        select(Account).where(
-            (Account.username == username) |
-            (Account.email == email)
-        )
+        _ACCOUNT_EXISTS_STMT, {"username": username, "email": email}
     )
     return result.scalar_one_or_none() is not None
 
 
-async def create_account_with_data(session: AsyncSession, username: str, email: str, password_hash: str, full_name: str = None) -> Account:
+async def create_account_with_data(session: AsyncSession, username: str, email: str, password_hash: str, full_name: str = None) -> Optional[Account]:
     """
     Create a new account with the provided data.
 
+    A single INSERT ... ON CONFLICT DO NOTHING replaces the old
+    SELECT-then-INSERT pair, so registration is one round-trip and the
+    username/email uniqueness race is closed by the DB itself.
+
     Args:
         session: Database session
         username: Account username
@@ -147,17 +266,17 @@ async def create_account_with_data(session: AsyncSession, username: str, email:
         full_name: Optional full name
 
     Returns:
-        Created account model
+        Created account model, or None if the username or email is taken
     """
-    new_account = Account(
+    stmt = pg_insert(Account).values(
         username=username,
         email=email,
         password_hash=password_hash,
         full_name=full_name,
         is_active=True
-    )
+    ).on_conflict_do_nothing().returning(Account)
 
-    session.add(new_account)
+    result = await session.execute(stmt)
+    new_account = result.scalars().first()
     await session.commit()
-    await session.refresh(new_account)
     return new_account
\ No newline at end of file
@@ -1,12 +1,27 @@
 """Bank Account repository for data access operations."""
 
 from typing import Optional, List
-from sqlalchemy import select, and_
+from sqlalchemy import bindparam, select, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
 from models.bank_account_model import BankAccount
 
+# Built once at import time so every call reuses the same statement object
+# (and its compiled-cache entry) instead of reconstructing the select.
+_BANK_ACCOUNT_BY_ID_STMT = select(BankAccount).where(
+    and_(
+        BankAccount.id == bindparam("bank_account_id"),
+        BankAccount.account_id == bindparam("account_id")
+    )
+)
+_BANK_ACCOUNT_BY_CONSENT_STMT = select(BankAccount).where(
+    BankAccount.consent_id == bindparam("consent_id")
+)
+_BANK_ACCOUNT_BY_ACCOUNT_STMT = select(BankAccount).where(
+    BankAccount.account_id == bindparam("account_id")
+)
+
 
 async def create_bank_account(
     session: AsyncSession,
@@ -27,8 +42,9 @@ async def create_bank_account(
         is_active=True
     )
     session.add(bank_account)
+    # Server defaults (PK, created_at) come back via the INSERT's RETURNING
+    # during flush, so no post-commit refresh round-trip is needed.
     await session.commit()
-    await session.refresh(bank_account)
     return bank_account
 
 
@@ -39,12 +55,8 @@ async def get_bank_account_by_id(
 ) -> Optional[BankAccount]:
     """Get bank account by ID, ensuring it belongs to the specified account."""
     result = await session.execute(
-        select(BankAccount).where(
-            and_(
-                BankAccount.id == bank_account_id,
-                BankAccount.account_id == account_id
-            )
-        )
+        _BANK_ACCOUNT_BY_ID_STMT,
+        {"bank_account_id": bank_account_id, "account_id": account_id}
     )
     return result.scalar_one_or_none()
 
@@ -55,7 +67,7 @@ async def get_bank_account_by_consent_id(
 ) -> Optional[BankAccount]:
     """Get bank account by consent ID."""
     result = await session.execute(
-        select(BankAccount).where(BankAccount.consent_id == consent_id)
+        _BANK_ACCOUNT_BY_CONSENT_STMT, {"consent_id": consent_id}
     )
     return result.scalar_one_or_none()
 
@@ -66,7 +78,7 @@ async def get_bank_account_by_account_id(
 ) -> Optional[BankAccount]:
     """Get bank account by account ID."""
     result = await session.execute(
-        select(BankAccount).where(BankAccount.account_id == account_id)
+        _BANK_ACCOUNT_BY_ACCOUNT_STMT, {"account_id": account_id}
     )
     return result.scalar_one_or_none()
 
@@ -78,10 +90,11 @@ async def update_bank_account_sync_time(
 ) -> BankAccount:
     """Update last synced timestamp."""
     result = await session.execute(
-        select(BankAccount).where(BankAccount.id == bank_account_id)
+        update(BankAccount)
+        .where(BankAccount.id == bank_account_id)
+        .values(last_synced_at=sync_time)
+        .returning(BankAccount)
     )
     bank_account = result.scalar_one()
-    bank_account.last_synced_at = sync_time
     await session.commit()
-    await session.refresh(bank_account)
     return bank_account
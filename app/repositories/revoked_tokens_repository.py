@@ -2,10 +2,23 @@
 
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import select, delete
+from sqlalchemy import bindparam, select, delete, func, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.revoked_token_model import RevokedToken
+from app.services import revocation_cache_service
+
+# Built once at import time so every call reuses the same statement object
+# (and its compiled-cache entry) instead of reconstructing the select.
+# Lookups compare 16-byte token hashes, not full JWTs.
+_TOKEN_REVOKED_STMT = (
+    select(literal(1))
+    .where(RevokedToken.token_hash == bindparam("token_hash"))
+    .limit(1)
+)
+_REVOKED_TOKEN_BY_HASH_STMT = select(RevokedToken).where(
+    RevokedToken.token_hash == bindparam("token_hash")
+)
 
 
 async def is_token_revoked(session: AsyncSession, token: str) -> bool:
@@ -20,10 +33,10 @@ async def is_token_revoked(session: AsyncSession, token: str) -> bool:
         True if token is revoked, False otherwise
     """
     result = await session.execute(
-        select(RevokedToken).where(RevokedToken.token == token)
+        _TOKEN_REVOKED_STMT,
+        {"token_hash": revocation_cache_service.hash_token(token)}
     )
-    revoked_token = result.scalar_one_or_none()
-    return revoked_token is not None
+    return result.scalar_one_or_none() is not None
 
 
 async def add_revoked_token(
@@ -50,6 +63,7 @@ async def add_revoked_token(
     """
     revoked_token = RevokedToken(
         token=token,
+        token_hash=revocation_cache_service.hash_token(token),
         user_id=user_id,
         user_type=user_type,
         token_type=token_type,
@@ -57,8 +71,17 @@ async def add_revoked_token(
     )
 
     session.add(revoked_token)
+    # Server defaults come back via the INSERT's RETURNING during flush,
+    # so no post-commit refresh round-trip is needed.
     await session.commit()
-    await session.refresh(revoked_token)
+
+    # Make the revocation effective on this instance immediately: drop the
+    # token's cached authorization and add it to the in-memory revoked set
+    # (invalidate_cached_token does both) instead of waiting for the TTL
+    # and the next background refresh to lapse. Imported here, mirroring
+    # the cleanup loop, to keep module-level imports one-way.
+    from app.services.authorization_service import invalidate_cached_token
+    invalidate_cached_token(token)
     return revoked_token
 
 
@@ -74,7 +97,8 @@ async def get_revoked_token(session: AsyncSession, token: str) -> Optional[Revok
         Revoked token model or None if not found
     """
     result = await session.execute(
-        select(RevokedToken).where(RevokedToken.token == token)
+        _REVOKED_TOKEN_BY_HASH_STMT,
+        {"token_hash": revocation_cache_service.hash_token(token)}
     )
     return result.scalar_one_or_none()
 
@@ -144,9 +168,9 @@ async def revoke_all_user_tokens(
     # This function would need to be implemented based on how you track active tokens
     # For now, we'll just count existing revoked tokens
     result = await session.execute(
-        select(RevokedToken).where(
+        select(func.count()).select_from(RevokedToken).where(
             (RevokedToken.user_id == user_id) &
             (RevokedToken.user_type == user_type)
         )
     )
-    return len(result.scalars().all())
\ No newline at end of file
+    return result.scalar_one()
\ No newline at end of file
@@ -1,10 +1,10 @@
 """Transaction repository for data access operations."""
 
-from typing import List
-from sqlalchemy import select, desc, func, and_
+from typing import List, Optional
+from sqlalchemy import select, desc, func, and_, tuple_, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
-from decimal import Decimal
 
 from models.transaction_model import Transaction
 
@@ -13,19 +13,53 @@ async def get_transactions_by_bank_account(
     session: AsyncSession,
     bank_account_id: int,
     limit: int = 100,
-    offset: int = 0
+    last_booking_date: Optional[datetime] = None,
+    last_id: Optional[int] = None
 ) -> List[Transaction]:
-    """Get transactions for a bank account with pagination."""
-    result = await session.execute(
+    """Get transactions for a bank account with keyset pagination.
+
+    Pages are addressed by the (booking_date, id) of the last row of the
+    previous page instead of OFFSET, so deep pages stay constant-time.
+    """
+    stmt = (
         select(Transaction)
         .where(Transaction.bank_account_id == bank_account_id)
-        .order_by(desc(Transaction.booking_date))
+        .order_by(desc(Transaction.booking_date), desc(Transaction.id))
         .limit(limit)
-        .offset(offset)
     )
+    if last_booking_date is not None and last_id is not None:
+        stmt = stmt.where(
+            tuple_(Transaction.booking_date, Transaction.id)
+            < (last_booking_date, last_id)
+        )
+    result = await session.execute(stmt)
     return list(result.scalars().all())
 
 
+async def get_transactions_page_with_total(
+    session: AsyncSession,
+    bank_account_id: int,
+    limit: int = 100
+) -> tuple:
+    """Get the first page of transactions plus the total in one round-trip.
+
+    COUNT(*) OVER () is evaluated before LIMIT, so each returned row
+    carries the full match count and no separate COUNT query is needed.
+    Only valid without a keyset cursor; a cursor in the WHERE clause
+    would shrink the window to the remaining rows.
+    """
+    result = await session.execute(
+        select(Transaction, func.count().over().label("total"))
+        .where(Transaction.bank_account_id == bank_account_id)
+        .order_by(desc(Transaction.booking_date), desc(Transaction.id))
+        .limit(limit)
+    )
+    rows = result.all()
+    if not rows:
+        return [], 0
+    return [row[0] for row in rows], rows[0][1]
+
+
 async def count_transactions_by_bank_account(
     session: AsyncSession,
     bank_account_id: int
@@ -38,51 +72,46 @@ async def count_transactions_by_bank_account(
     return result.scalar()
 
 
-async def transaction_exists(
-    session: AsyncSession,
-    bank_account_id: int,
-    transaction_id: str
-) -> bool:
-    """Check if transaction already exists."""
-    result = await session.execute(
-        select(Transaction).where(
-            and_(
-                Transaction.bank_account_id == bank_account_id,
-                Transaction.transaction_id == transaction_id
-            )
-        )
-    )
-    return result.scalar_one_or_none() is not None
-
-
 async def transaction_exists_by_details(
     session: AsyncSession,
     bank_account_id: int,
     booking_date: datetime,
-    amount: Decimal,
+    amount_minor: int,
     creditor_account_last4: str | None,
     debtor_account_last4: str | None
 ) -> bool:
     """Check if transaction exists based on composite unique key."""
     result = await session.execute(
-        select(Transaction).where(
+        select(literal(1)).where(
             and_(
                 Transaction.bank_account_id == bank_account_id,
                 Transaction.booking_date == booking_date,
-                Transaction.amount == amount,
+                Transaction.amount_minor == amount_minor,
                 Transaction.creditor_account_last4 == creditor_account_last4,
                 Transaction.debtor_account_last4 == debtor_account_last4
             )
-        )
+        ).limit(1)
     )
     return result.scalar_one_or_none() is not None
 
 
 async def bulk_create_transactions(
     session: AsyncSession,
-    transactions: List[Transaction]
+    transactions: List[dict]
 ) -> int:
-    """Bulk insert transactions."""
-    session.add_all(transactions)
+    """Bulk insert transactions in one statement, deduplicating in the DB.
+
+    Rows that collide on the composite dedup index are silently skipped,
+    so callers no longer need per-row existence checks before inserting.
+    """
+    if not transactions:
+        return 0
+    stmt = pg_insert(Transaction).values(transactions).on_conflict_do_nothing(
+        index_elements=[
+            'bank_account_id', 'booking_date', 'amount_minor',
+            'creditor_account_last4', 'debtor_account_last4'
+        ]
+    )
+    result = await session.execute(stmt)
     await session.commit()
-    return len(transactions)
+    return result.rowcount
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories import account_repository
 from app.types.account_dtos import AccountCreate, AccountResponse
 from app.types.auth_dtos import TokenPair
-from app.utils.password import hash_password, verify_password
+from app.utils.password import hash_password_async, verify_password_async
 from app.utils.token_utils import create_access_token, create_refresh_token, decode_refresh_token
 
 
@@ -25,17 +25,11 @@ async def register_account(session: AsyncSession, account_data: AccountCreate) -
     Raises:
         HTTPException: If username or email already exists
     """
-    # Check if username or email already exists
-    if await account_repository.account_exists_by_username_or_email(
-        session, account_data.username, account_data.email
-    ):
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Username or email already exists"
-        )
+    # Hash password off the event loop (bcrypt is CPU-bound by design)
+    hashed_password = await hash_password_async(account_data.password)
 
-    # Hash password and create account
-    hashed_password = hash_password(account_data.password)
+    # The insert itself detects username/email collisions via ON CONFLICT,
+    # so no separate existence check (and no race window) is needed.
     new_account = await account_repository.create_account_with_data(
         session=session,
         username=account_data.username,
@@ -44,6 +38,12 @@ async def register_account(session: AsyncSession, account_data: AccountCreate) -
         full_name=account_data.full_name
     )
 
+    if new_account is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Username or email already exists"
+        )
+
     return AccountResponse.model_validate(new_account)
 
 
@@ -78,15 +78,22 @@ async def login_account(session: AsyncSession, email: str, password: str) -> Tok
             detail="Account is disabled"
         )
 
-    # Verify password
-    if not verify_password(password, account.password_hash):
+    # Verify password off the event loop (bcrypt is CPU-bound by design)
+    if not await verify_password_async(password, account.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
         )
 
     # Create tokens
-    access_token = create_access_token(account.id, account.email)
+    access_token = create_access_token(
+        account.id,
+        account.email,
+        username=account.username,
+        full_name=account.full_name,
+        is_active=account.is_active,
+        created_at=account.created_at
+    )
     refresh_token = create_refresh_token(account.id, account.email)
 
     return TokenPair(
@@ -129,7 +136,14 @@ async def refresh_tokens(session: AsyncSession, refresh_token: str) -> TokenPair
         )
 
     # Create new tokens
-    access_token = create_access_token(account.id, account.email)
+    access_token = create_access_token(
+        account.id,
+        account.email,
+        username=account.username,
+        full_name=account.full_name,
+        is_active=account.is_active,
+        created_at=account.created_at
+    )
     new_refresh_token = create_refresh_token(account.id, account.email)
 
     return TokenPair(
@@ -1,6 +1,10 @@
 """Authorization service with dependency injection for FastAPI."""
 
+import hashlib
+import threading
 from typing import Any, Callable, Coroutine, Optional
+
+from cachetools import TTLCache
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,7 +13,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.db.database import get_session
 
 # Import repositories
-from app.repositories import account_repository, revoked_tokens_repository
+from app.repositories import account_repository
+
+# Import in-memory revocation set (refreshed by a background task)
+from app.services import revocation_cache_service
 
 # Import DTOs and exceptions
 from app.types.account_dtos import AccountRead
@@ -21,6 +28,29 @@ from app.utils.settings import INTERNAL_API_KEY
 
 security = HTTPBearer()
 
+# Short-lived cache of authorized accounts keyed by sha256 of the bearer token.
+# The TTL bounds how long a freshly revoked token can still authorize, so it
+# must stay small (seconds, not minutes). Failures are never cached.
+_account_cache: TTLCache = TTLCache(maxsize=10000, ttl=10)
+_account_cache_lock = threading.Lock()
+
+# Longer-lived cache of accounts keyed by id so all tokens of an account
+# share one entry on the DB-lookup fallback path.
+_account_by_id_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_lookup_cache_lock = threading.Lock()
+
+
+def invalidate_cached_token(token: str) -> None:
+    """Drop cached authorization state for a token.
+
+    Must be called by any path that revokes a token, otherwise the caches
+    keep honoring it until their TTLs lapse.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    with _account_cache_lock:
+        _account_cache.pop(key, None)
+    revocation_cache_service.note_token_revoked(token)
+
 
 def _is_internal_bypass_token(token: str) -> bool:
     """Check if token is an internal API key for service-to-service communication."""
@@ -41,8 +71,17 @@ async def _authorize_authenticated_account_or_internal_request(
     if _is_internal_bypass_token(token):
         return None
 
-    # Check if token is revoked
-    if await revoked_tokens_repository.is_token_revoked(session, token):
+    # Serve recently authorized tokens from cache, skipping JWT verification
+    # and both DB lookups for chatty clients.
+    cache_key = hashlib.sha256(token.encode()).digest()
+    with _account_cache_lock:
+        cached = _account_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Check the in-memory revocation set (kept fresh by a background task);
+    # no DB probe on the hot path.
+    if revocation_cache_service.is_token_revoked(token):
         raise AuthorizationException("Token has been revoked.")
 
     # Decode and validate JWT token
@@ -56,21 +95,47 @@ async def _authorize_authenticated_account_or_internal_request(
     if not account_id:
         raise AuthorizationException("Missing account ID.")
 
-    # Retrieve account from database
-    account_model = await account_repository.get_account_by_id(session, account_id)
-    if not account_model:
-        raise AuthorizationException("Account not found.")
-
-    # Convert to AccountRead DTO with proper field mapping
-    return AccountRead(
-        account_id=account_model.id,
-        email=account_model.email,
-        username=account_model.username,
-        full_name=account_model.full_name,
-        account_verified=account_model.is_active,
-        created_at=account_model.created_at,
-        last_login=None  # This would need to be tracked separately if needed
-    )
+    # Fast path: tokens minted with profile claims carry everything AccountRead
+    # needs, so no DB lookup at all. Staleness is bounded by the token TTL.
+    if "username" in payload and "created_at" in payload:
+        account = AccountRead(
+            account_id=account_id,
+            email=payload.get("email"),
+            username=payload["username"],
+            full_name=payload.get("full_name"),
+            account_verified=payload.get("is_active", True),
+            created_at=payload["created_at"],
+            last_login=None
+        )
+        with _account_cache_lock:
+            _account_cache[cache_key] = account
+        return account
+
+    # Retrieve account, shared across all of the account's tokens
+    with _lookup_cache_lock:
+        account = _account_by_id_cache.get(account_id)
+    if account is None:
+        account_model = await account_repository.get_account_lite(session, account_id)
+        if not account_model:
+            raise AuthorizationException("Account not found.")
+
+        # Convert to AccountRead DTO with proper field mapping
+        account = AccountRead(
+            account_id=account_model.id,
+            email=account_model.email,
+            username=account_model.username,
+            full_name=account_model.full_name,
+            account_verified=account_model.is_active,
+            created_at=account_model.created_at,
+            last_login=None  # This would need to be tracked separately if needed
+        )
+        with _lookup_cache_lock:
+            _account_by_id_cache[account_id] = account
+
+    with _account_cache_lock:
+        _account_cache[cache_key] = account
+
+    return account
 
 
 def authorize_authenticated_account(
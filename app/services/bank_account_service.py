@@ -1,11 +1,16 @@
 """Bank Account service for business logic."""
 
-import requests
+import asyncio
+import logging
+
+import httpx
 from datetime import datetime, timedelta
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters.db.database import AsyncSessionLocal
 from app.repositories import bank_account_repository
+from app.bank.client import get_bank_client
 from app.bank.vpbank import VPBank
 from app.types.bank_account_dtos import (
     BankAccountResponse,
@@ -13,11 +18,14 @@ from app.types.bank_account_dtos import (
     BalanceResponse
 )
 from app.types.exceptions import (
+    BankApiException,
     BusinessRuleException,
     ConflictException,
     NotFoundException
 )
 
+log = logging.getLogger(__name__)
+
 
 async def get_user_bank_account(
     session: AsyncSession,
@@ -61,7 +69,8 @@ async def get_balance(
 
     Raises:
         NotFoundException: If bank account not found
-        BusinessRuleException: If consent expired or balance fetch fails
+        BusinessRuleException: If consent expired
+        BankApiException: If the bank call fails (upstream error or transport failure)
     """
     # Get and validate bank account ownership
     bank_account = await bank_account_repository.get_bank_account_by_id(
@@ -74,37 +83,31 @@ async def get_balance(
     if bank_account.consent_status != "valid":
         raise BusinessRuleException(f"Consent is {bank_account.consent_status}")
 
-    # Initialize bank client
-    bank_session = requests.Session()
-    bank_session.headers.update({
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "TPP-Redirect-URI": "https://www.google.ch",
-        "PSU-IP-Address": "192.0.0.12",
-        "Consent-ID": bank_account.consent_id
-    })
-
-    bank_client = VPBank(bank_session)
+    # Reuse the shared bank client; the consent is passed per request
+    bank_client = VPBank(get_bank_client(), consent_id=bank_account.consent_id)
 
     try:
         # Fetch balance from bank
-        success, balance_data = bank_client.get_balance(
+        success, balance_data = await bank_client.get_balance(
             bank_account.iban,
             f"Balance check for bank_account_id {bank_account_id}"
         )
-
-        if not success or not balance_data:
-            raise BusinessRuleException("Failed to fetch balance from bank")
-
-        return BalanceResponse(
-            amount=balance_data.get("amount", "0"),
-            currency=balance_data.get("currency", "EUR")
-        )
-
-    except requests.exceptions.HTTPError as e:
-        raise BusinessRuleException(f"Bank API error: {str(e)}")
-    except Exception as e:
-        raise BusinessRuleException(f"Failed to get balance: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        # No str(e)/traceback formatting here; the handler renders the
+        # error code and upstream status once.
+        raise BankApiException("bank_balance_fetch_failed", e.response.status_code)
+    except httpx.RequestError:
+        # Transport-level failure (connect/read/pool timeout): no upstream
+        # status to report, but still a structured 502 rather than a 500.
+        raise BankApiException("bank_balance_fetch_failed")
+
+    if not success or not balance_data:
+        raise BankApiException("bank_balance_fetch_failed")
+
+    return BalanceResponse(
+        amount=balance_data.get("amount", "0"),
+        currency=balance_data.get("currency", "EUR")
+    )
 
 
 async def link_bank_account(
@@ -124,76 +127,86 @@ async def link_bank_account(
         Created bank account
 
     Raises:
-        ConflictException: If user already has a bank account or consent creation fails
-        BusinessRuleException: If IBAN cannot be retrieved
+        ConflictException: If user already has a bank account linked
+        BusinessRuleException: If the bank provider is unsupported
+        BankApiException: If consent creation, IBAN discovery or validation fails
     """
-    # Check if user already has a bank account
-    existing_account = await bank_account_repository.get_bank_account_by_account_id(
-        session, account_id
-    )
-    if existing_account:
-        raise ConflictException("User already has a bank account linked")
-
     # Initialize bank client (currently only VPBank)
     if bank_provider != BankProviderEnum.VPBANK:
         raise BusinessRuleException("Only VPBank is currently supported")
 
-    # Create requests session with required headers
-    bank_session = requests.Session()
-    bank_session.headers.update({
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "TPP-Redirect-URI": "https://www.google.ch",
-        "PSU-IP-Address": "192.0.0.12"
-    })
+    # Reuse the shared bank client; the consent flow stores the new
+    # consent id on this VPBank instance rather than on the client
+    bank_client = VPBank(get_bank_client())
+
+    # The DB probes that overlap bank round-trips below get their own pooled
+    # sessions: if the bank coroutine raises, gather propagates while the DB
+    # coroutine may still be mid-statement, and FastAPI's teardown would then
+    # roll back the request session it is still using ("another operation is
+    # in progress"). Same pattern as the parallel count in transaction_service.
+    async def _get_by_account_id():
+        async with AsyncSessionLocal() as probe_session:
+            return await bank_account_repository.get_bank_account_by_account_id(
+                probe_session, account_id
+            )
 
-    bank_client = VPBank(bank_session)
+    async def _get_by_consent_id(consent_id: str):
+        async with AsyncSessionLocal() as probe_session:
+            return await bank_account_repository.get_bank_account_by_consent_id(
+                probe_session, consent_id
+            )
 
     try:
-        # Create consent and get IBAN
-        iban = bank_client.create_consent_and_get_iban()
-
-        # Extract consent ID from session headers
-        consent_id = bank_session.headers.get("Consent-ID")
-        if not consent_id:
-            raise BusinessRuleException("Failed to retrieve consent ID from bank")
-
-        # Validate IBAN by attempting to fetch balance
-        print(f"Validating IBAN {iban} by fetching balance...")
-        success, balance_data = bank_client.get_balance(
-            iban,
-            f"IBAN validation for account_id {account_id}"
+        # Overlap the "already linked?" DB probe with the consent-creation
+        # bank round-trip; they are independent.
+        existing_account, iban = await asyncio.gather(
+            _get_by_account_id(),
+            bank_client.create_consent_and_get_iban()
         )
+        if existing_account:
+            raise ConflictException("User already has a bank account linked")
 
-        if not success:
-            raise BusinessRuleException(
-                f"IBAN {iban} is not accessible or invalid. "
-                "The bank API returned an error when trying to access this account."
-            )
-
-        # Set consent validity (90 days as per VPBank implementation)
-        consent_valid_until = datetime.now() + timedelta(days=90)
-
-        # Check if consent already exists
-        existing = await bank_account_repository.get_bank_account_by_consent_id(
-            session, consent_id
-        )
-        if existing:
-            raise ConflictException("This bank account is already linked")
-
-        # Create bank account record
-        bank_account = await bank_account_repository.create_bank_account(
-            session=session,
-            account_id=account_id,
-            bank_provider="vpbank",
-            consent_id=consent_id,
-            iban=iban,
-            consent_valid_until=consent_valid_until
+        consent_id = bank_client.consent_id
+        if not consent_id:
+            raise BankApiException("bank_consent_creation_failed")
+
+        # Validate IBAN by fetching balance while checking for a duplicate
+        # consent in parallel: the bank round-trip and the DB lookup are
+        # independent, so wall-clock is max(RTT) instead of the sum.
+        log.debug("Validating IBAN %s by fetching balance", iban)
+        (success, balance_data), existing = await asyncio.gather(
+            bank_client.get_balance(
+                iban,
+                f"IBAN validation for account_id {account_id}"
+            ),
+            _get_by_consent_id(consent_id)
         )
+    except httpx.HTTPStatusError as e:
+        raise BankApiException("bank_link_failed", e.response.status_code)
+    except httpx.RequestError:
+        # Transport-level failure (connect/read/pool timeout)
+        raise BankApiException("bank_link_failed")
+    except ValueError:
+        # The consent came back without any accessible account
+        raise BankApiException("bank_no_accessible_iban")
+
+    if not success:
+        raise BankApiException("bank_iban_not_accessible")
+
+    # Set consent validity (90 days as per VPBank implementation)
+    consent_valid_until = datetime.now() + timedelta(days=90)
+
+    if existing:
+        raise ConflictException("This bank account is already linked")
+
+    # Create bank account record
+    bank_account = await bank_account_repository.create_bank_account(
+        session=session,
+        account_id=account_id,
+        bank_provider="vpbank",
+        consent_id=consent_id,
+        iban=iban,
+        consent_valid_until=consent_valid_until
+    )
 
-        return BankAccountResponse.model_validate(bank_account)
-
-    except requests.exceptions.HTTPError as e:
-        raise BusinessRuleException(f"Bank API error: {str(e)}")
-    except Exception as e:
-        raise BusinessRuleException(f"Failed to link bank account: {str(e)}")
+    return BankAccountResponse.model_validate(bank_account)
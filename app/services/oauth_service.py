@@ -1,5 +1,7 @@
 """OAuth service for Google authentication."""
 
+import re
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.oauth.google_oauth_adapter import (
@@ -10,9 +12,14 @@ from app.adapters.oauth.google_oauth_adapter import (
 from app.repositories import account_repository
 from app.types.auth_dtos import TokenPair
 from app.types.exceptions import AuthenticationException
+from app.utils.settings import BLOCKED_OAUTH_EMAILS
 from app.utils.token_utils import create_access_token, create_refresh_token
 from models.account_model import Account
 
+# Cheap sanity check, not full RFC validation: Google already vouched for
+# the address, this just keeps garbage from reaching the DB lookup.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 async def login_or_register_with_google(
     session: AsyncSession, code: str, code_verifier: str, redirect_uri: str
@@ -41,11 +48,15 @@ async def login_or_register_with_google(
     if not email:
         raise AuthenticationException("ID token missing email")
 
-    # Fetch full user profile
-    profile = fetch_full_profile(creds)
+    # Fast-fail malformed and blocked addresses before any DB round-trip
+    if not _EMAIL_RE.match(email):
+        raise AuthenticationException("Invalid email address")
+    if email.lower() in BLOCKED_OAUTH_EMAILS:
+        raise AuthenticationException("Account is not permitted to sign in")
 
-    # Check if user already exists
-    existing_account = await account_repository.get_account_by_email(session, email)
+    # Check if user already exists; repeat Google logins for the same user
+    # hit the short TTL cache instead of the DB
+    existing_account = await account_repository.get_account_by_email_cached(session, email)
 
     if existing_account:
         # User exists, check if active
@@ -53,20 +64,25 @@ async def login_or_register_with_google(
             raise AuthenticationException("Account is disabled")
         account = existing_account
     else:
-        # Create new user account
+        # Name fields are only needed when creating the account, and the
+        # ID token already carries them when the profile scope was granted
+        # — only fall back to Google's userinfo endpoint (an extra network
+        # round-trip) when they are absent.
+        if "given_name" in idinfo or "name" in idinfo:
+            profile = idinfo
+        else:
+            profile = fetch_full_profile(creds)
+
+        # Create new user account; split the display name once and reuse
+        # the parts instead of re-splitting per field
+        name_parts = (profile.get("name") or "").split()
         first_name = (
             profile.get("given_name")
-            or profile.get("name", "").split()[0]
-            or "User"
+            or (name_parts[0] if name_parts else "User")
         )
         last_name = (
             profile.get("family_name")
-            or (
-                profile.get("name", "").split()[1]
-                if len(profile.get("name", "").split()) > 1
-                else ""
-            )
-            or ""
+            or (name_parts[1] if len(name_parts) > 1 else "")
         )
 
         full_name = f"{first_name} {last_name}".strip()
@@ -74,12 +90,18 @@ async def login_or_register_with_google(
         # Generate username from email (before @)
         username = email.split("@")[0]
 
-        # Ensure username uniqueness
-        counter = 1
-        original_username = username
-        while await account_repository.get_account_by_username(session, username):
+        # Ensure username uniqueness: fetch every taken candidate in one
+        # query and pick the first free suffix in Python, instead of one
+        # SELECT per collision.
+        taken = await account_repository.get_usernames_matching_prefix(
+            session, username
+        )
+        if username in taken:
+            original_username = username
+            counter = 1
+            while f"{original_username}{counter}" in taken:
+                counter += 1
             username = f"{original_username}{counter}"
-            counter += 1
 
         # Create account with dummy password hash (OAuth users don't use password login)
         account = await account_repository.create_account_with_data(
@@ -89,9 +111,21 @@ async def login_or_register_with_google(
             password_hash="oauth_user_no_password",  # Placeholder for OAuth users
             full_name=full_name
         )
+        if account is None:
+            # Lost a concurrent registration race; the account exists now
+            account = await account_repository.get_account_by_email(session, email)
+            if account is None:
+                raise AuthenticationException("Failed to create account")
 
     # Generate JWT tokens
-    access_token = create_access_token(account.id, account.email)
+    access_token = create_access_token(
+        account.id,
+        account.email,
+        username=account.username,
+        full_name=account.full_name,
+        is_active=account.is_active,
+        created_at=account.created_at
+    )
     refresh_token = create_refresh_token(account.id, account.email)
 
     return TokenPair(
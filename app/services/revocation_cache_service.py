@@ -0,0 +1,104 @@
+"""In-memory revoked-token set, refreshed from the DB by a background task.
+
+Every authenticated request used to probe the revoked_tokens table. The
+revocation set is small and changes rarely, so the whole set is held in
+process memory as blake2b digests (16 bytes per token) and swapped
+atomically by a periodic refresh task. The auth hot path then answers
+"is this token revoked?" with a set lookup and zero DB traffic.
+
+Revocations made by this instance are added optimistically so they take
+effect immediately; revocations made elsewhere become visible after the
+next refresh (bounded by REFRESH_INTERVAL_SECONDS).
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from app.adapters.db.database import AsyncSessionLocal
+from models.revoked_token_model import RevokedToken
+
+log = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_SECONDS = 30
+CLEANUP_INTERVAL_SECONDS = 86400
+
+# Snapshot of revoked-token digests, replaced wholesale on each refresh.
+# _local_adds holds revocations made since the last refresh so they are
+# effective immediately on this instance.
+_revoked_hashes: frozenset = frozenset()
+_local_adds: set = set()
+_state_lock = threading.Lock()
+
+
+def hash_token(token: str) -> bytes:
+    """Hash a token to its 16-byte blake2b digest.
+
+    The same digest is used for in-memory set storage and for the
+    revoked_tokens.token_hash DB column.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def is_token_revoked(token: str) -> bool:
+    """Check a token against the in-memory revocation set."""
+    key = hash_token(token)
+    with _state_lock:
+        return key in _revoked_hashes or key in _local_adds
+
+
+def note_token_revoked(token: str) -> None:
+    """Record a revocation immediately, ahead of the next DB refresh."""
+    key = hash_token(token)
+    with _state_lock:
+        _local_adds.add(key)
+
+
+async def refresh_revoked_set() -> None:
+    """Reload the revocation set from the DB and swap it in atomically."""
+    global _revoked_hashes
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(RevokedToken.token_hash).where(
+                RevokedToken.expires_at > datetime.now(timezone.utc)
+            )
+        )
+        hashes = result.scalars().all()
+
+    fresh = frozenset(hashes)
+    with _state_lock:
+        _revoked_hashes = fresh
+        # Anything this instance revoked is now in the DB snapshot.
+        _local_adds.difference_update(fresh)
+
+
+async def revoked_set_refresh_loop() -> None:
+    """Background task: refresh the revocation set every few seconds."""
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
+        try:
+            await refresh_revoked_set()
+        except Exception as e:
+            # Keep serving the previous snapshot if the DB is unavailable.
+            log.warning("Revoked-token refresh failed: %s", e)
+
+
+async def expired_token_cleanup_loop() -> None:
+    """Background task: purge expired rows from revoked_tokens daily."""
+    # Imported here to keep the repository -> service import one-way at
+    # module load time (the repository notes revocations into this cache).
+    from app.repositories import revoked_tokens_repository
+
+    while True:
+        await asyncio.sleep(CLEANUP_INTERVAL_SECONDS)
+        try:
+            async with AsyncSessionLocal() as session:
+                removed = await revoked_tokens_repository.cleanup_expired_tokens(session)
+            if removed:
+                log.info("Removed %d expired revoked tokens", removed)
+        except Exception as e:
+            log.warning("Expired-token cleanup failed: %s", e)
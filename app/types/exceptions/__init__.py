@@ -1,28 +1,44 @@
 class BusinessRuleException(Exception):
     """Raised when a business rule is violated"""
-    pass
+    __slots__ = ()
 
 
 class ConflictException(Exception):
     """Raised when there's a conflict (e.g., resource already exists)"""
-    pass
+    __slots__ = ()
 
 
 class NotFoundException(Exception):
     """Raised when a resource is not found"""
-    pass
+    __slots__ = ()
 
 
-class ResourceNotFound(Exception):
-    """Raised when a resource is not found (alias for NotFoundException)"""
-    pass
+# Backwards-compatible alias; handlers and isinstance checks now hit the
+# same class instead of two parallel hierarchies for the same condition.
+ResourceNotFound = NotFoundException
 
 
 class AuthenticationException(Exception):
     """Raised when authentication fails"""
-    pass
+    __slots__ = ()
 
 
 class AuthorizationException(Exception):
     """Raised when authorization fails (forbidden access)"""
-    pass
+    __slots__ = ()
+
+
+class BankApiException(BusinessRuleException):
+    """Raised when the upstream bank API returns an error response.
+
+    Carries a stable error code plus the upstream status code instead of an
+    interpolated message, so the raise path does no string formatting; the
+    exception handler renders it once.
+    """
+
+    __slots__ = ("error_code", "upstream_status")
+
+    def __init__(self, error_code: str, upstream_status: int | None = None):
+        super().__init__(error_code)
+        self.error_code = error_code
+        self.upstream_status = upstream_status
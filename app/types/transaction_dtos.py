@@ -39,6 +39,8 @@ class TransactionListResponse(BaseModel):
     transactions: list[TransactionResponse]
     total: int
     bank_account_id: int
+    # Opaque keyset cursor for the next page; None when this is the last page.
+    next_cursor: Optional[str] = None
 
 
 class SyncTransactionsResponse(BaseModel):
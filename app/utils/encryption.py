@@ -1,57 +1,49 @@
 """Encryption utilities for sensitive data."""
 
-from cryptography.fernet import Fernet
+from functools import cache
 from typing import Optional
 
+from cryptography.fernet import Fernet
 
-class EncryptionService:
-    """Service for encrypting and decrypting sensitive data."""
-
-    _instance = None
-    _cipher = None
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+@cache
+def _get_cipher() -> Fernet:
+    """Build the Fernet cipher once; every later call returns the same instance.
 
-    def _get_cipher(self):
-        """Lazy-load cipher on first use."""
-        if self._cipher is None:
-            from app.utils.settings import ENCRYPTION_KEY
-            if not ENCRYPTION_KEY:
-                raise ValueError("ENCRYPTION_KEY must be set in environment variables")
-            self._cipher = Fernet(ENCRYPTION_KEY.encode())
-        return self._cipher
+    Raises:
+        ValueError: If ENCRYPTION_KEY is not configured
+    """
+    from app.utils.settings import ENCRYPTION_KEY
+    if not ENCRYPTION_KEY:
+        raise ValueError("ENCRYPTION_KEY must be set in environment variables")
+    return Fernet(ENCRYPTION_KEY.encode())
 
-    def encrypt(self, plaintext: Optional[str]) -> Optional[str]:
-        """
-        Encrypt plaintext string.
 
-        Args:
-            plaintext: String to encrypt
+def encrypt(plaintext: Optional[str]) -> Optional[str]:
+    """
+    Encrypt plaintext string.
 
-        Returns:
-            Base64-encoded encrypted string, or None if input is None
-        """
-        if plaintext is None:
-            return None
-        return self._get_cipher().encrypt(plaintext.encode()).decode()
+    Args:
+        plaintext: String to encrypt
 
-    def decrypt(self, ciphertext: Optional[str]) -> Optional[str]:
-        """
-        Decrypt encrypted string.
+    Returns:
+        Base64-encoded encrypted string, or None if input is None
+    """
+    if plaintext is None:
+        return None
+    return _get_cipher().encrypt(plaintext.encode()).decode()
 
-        Args:
-            ciphertext: Encrypted string to decrypt
 
-        Returns:
-            Decrypted plaintext string, or None if input is None
-        """
-        if ciphertext is None:
-            return None
-        return self._get_cipher().decrypt(ciphertext.encode()).decode()
+def decrypt(ciphertext: Optional[str]) -> Optional[str]:
+    """
+    Decrypt encrypted string.
 
+    Args:
+        ciphertext: Encrypted string to decrypt
 
-# Singleton instance
-encryption_service = EncryptionService()
+    Returns:
+        Decrypted plaintext string, or None if input is None
+    """
+    if ciphertext is None:
+        return None
+    return _get_cipher().decrypt(ciphertext.encode()).decode()
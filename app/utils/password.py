@@ -1,7 +1,17 @@
-"""Password hashing and verification utilities using bcrypt."""
+"""Password hashing and verification utilities using bcrypt.
+
+The sync functions are CPU-bound (bcrypt's native backend burns tens of
+milliseconds by design); async callers should use the ``*_async``
+variants, which run them in a worker thread so the event loop stays
+free for concurrent requests.
+"""
+
+import asyncio
 
 import bcrypt
 
+from app.utils.settings import BCRYPT_ROUNDS
+
 
 def hash_password(password: str) -> str:
     """
@@ -13,7 +23,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password as a string
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -29,4 +39,14 @@ def verify_password(password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches hash, False otherwise
     """
-    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
\ No newline at end of file
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in a worker thread without blocking the event loop."""
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread without blocking the event loop."""
+    return await asyncio.to_thread(verify_password, password, hashed_password)
\ No newline at end of file
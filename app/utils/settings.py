@@ -12,6 +12,17 @@ ACCOUNT_SECRET_KEY = os.getenv("ACCOUNT_SECRET_KEY")
 # Internal API key for service-to-service communication
 INTERNAL_API_KEY = os.getenv("INTERNAL_API_KEY")
 
+# CORS: comma-separated list of allowed origins. An explicit list keeps
+# Starlette on its fast set-membership path and is required for browsers
+# to honor credentialed requests (wildcard + credentials is invalid CORS).
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS", "http://localhost:3000,http://localhost:5173"
+    ).split(",")
+    if origin.strip()
+)
+
 # DATABASE
 DB_HOST = os.environ.get("DB_HOST", "localhost")
 DB_NAME = os.environ.get("DB_NAME", "vinatien_db")
@@ -19,6 +30,12 @@ DB_USER = os.environ.get("DB_USER", "root")
 DB_PASSWORD = os.environ.get("DB_PASSWORD", "root")
 DB_PORT = os.getenv("DB_PORT", "5432")
 
+# Connection pool tuning for the async engine
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 40))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))  # seconds
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # 30 minutes
+
 # Async for app (using asyncpg for PostgreSQL)
 DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
@@ -32,6 +49,17 @@ ACCESS_TOKEN_EXPIRES_IN = int(os.getenv("ACCESS_TOKEN_EXPIRES_IN", 3600))  # 1 h
 REFRESH_TOKEN_EXPIRES_IN = int(os.getenv("REFRESH_TOKEN_EXPIRES_IN", 86400))  # 24 hours
 JWT_SIGNING_ALGORITHM = os.getenv("JWT_SIGNING_ALGORITHM", "HS256")
 
+# Account lookup cache for the OAuth login hot path; TTL in seconds,
+# 0 disables caching. Reads served from it may lag is_active changes by
+# up to the TTL.
+ACCOUNT_CACHE_TTL = int(os.getenv("ACCOUNT_CACHE_TTL", 30))
+ACCOUNT_CACHE_MAXSIZE = int(os.getenv("ACCOUNT_CACHE_MAXSIZE", 4096))
+
+# PASSWORD HASHING
+# bcrypt cost factor; each +1 doubles hashing time. Tune so a hash lands
+# around ~50ms on production hardware.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+
 # GOOGLE OAUTH SETTINGS
 GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID", "")
 GOOGLE_CLIENT_SECRET = os.environ.get("GOOGLE_CLIENT_SECRET", "")
@@ -41,6 +69,16 @@ GOOGLE_REDIRECT_URI = (
     if GOOGLE_REDIRECT_URIS and GOOGLE_REDIRECT_URIS[0]
     else os.environ.get("GOOGLE_REDIRECT_URI", "")
 )
+GOOGLE_ID_TOKEN_CACHE_TTL = int(os.getenv("GOOGLE_ID_TOKEN_CACHE_TTL", 60))  # seconds
+GOOGLE_ID_TOKEN_CACHE_MAXSIZE = int(os.getenv("GOOGLE_ID_TOKEN_CACHE_MAXSIZE", 10000))
+
+# Comma-separated list of OAuth emails (service/synthetic accounts) that
+# must never log in; rejected before any DB work.
+BLOCKED_OAUTH_EMAILS = frozenset(
+    email.strip().lower()
+    for email in os.getenv("BLOCKED_OAUTH_EMAILS", "").split(",")
+    if email.strip()
+)
 
 # ENCRYPTION SETTINGS
 # Generate using: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
@@ -12,34 +12,58 @@ from app.utils.settings import (
 )
 from app.types.exceptions import AuthenticationException
 
-
-def create_access_token(account_id: int, email: str, expires_delta: Optional[timedelta] = None) -> str:
+# Token lifetimes never change at runtime; build the timedeltas once
+# instead of per token issued.
+_ACCESS_TD = timedelta(seconds=ACCESS_TOKEN_EXPIRES_IN)
+_REFRESH_TD = timedelta(seconds=REFRESH_TOKEN_EXPIRES_IN)
+
+
+def create_access_token(
+    account_id: int,
+    email: str,
+    expires_delta: Optional[timedelta] = None,
+    *,
+    username: Optional[str] = None,
+    full_name: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    created_at: Optional[datetime] = None
+) -> str:
     """
     Create an access token for an account.
 
+    When the profile claims (username/is_active/created_at) are supplied, the
+    authorization service can rebuild the account from the token alone and
+    skip its DB lookup; staleness is bounded by the token lifetime.
+
     Args:
         account_id: The account ID
         email: The account email
         expires_delta: Optional custom expiration time
+        username: Optional account username claim
+        full_name: Optional full name claim
+        is_active: Optional active flag claim
+        created_at: Optional account creation time claim
 
     Returns:
         JWT access token as string
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            seconds=ACCESS_TOKEN_EXPIRES_IN
-        )
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta if expires_delta else _ACCESS_TD)
 
     payload = {
         "sub": str(account_id),
         "account_id": account_id,
         "email": email,
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "iat": now,
         "type": "access"
     }
+    if username is not None:
+        payload["username"] = username
+        payload["full_name"] = full_name
+        payload["is_active"] = is_active if is_active is not None else True
+        if created_at is not None:
+            payload["created_at"] = created_at.isoformat()
 
     return jwt.encode(
         payload,
@@ -59,15 +83,13 @@ def create_refresh_token(account_id: int, email: str) -> str:
     Returns:
         JWT refresh token as string
     """
-    expire = datetime.now(timezone.utc) + timedelta(
-        seconds=REFRESH_TOKEN_EXPIRES_IN
-    )
+    now = datetime.now(timezone.utc)
 
     payload = {
         "sub": str(account_id),
         "email": email,
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": now + _REFRESH_TD,
+        "iat": now,
         "type": "refresh"
     }
 
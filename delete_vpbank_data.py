@@ -1,147 +1,73 @@
-import requests
-import json
-import uuid
-from datetime import datetime, timedelta
-import time
+import asyncio
 
-# --- CONFIGURATION ---
-BASE_URL = "https://developer.vpbank.com/psd2/berlin-group/v1"
+import httpx
+from app.bank.client import build_bank_transport
+from app.bank.vpbank import VPBank
 
-def print_step(title, data):
-    print(f"\n--- {title} ---")
-    print(json.dumps(data, indent=2))
+# Upper bound on in-flight cleanup pipelines; the bank sandbox tolerates
+# far less than the client's connection pool allows.
+MAX_CONCURRENT_CLEANUPS = 64
 
-def generate_request_id(last_digit='1'):
-    """Generates a random UUID, allowing the last digit to be controlled for mock status."""
-    base_uuid = str(uuid.uuid4())
-    return base_uuid[:-1] + last_digit
 
-# --- AISP Functions (to get the working IBAN) ---
-
-def create_consent_and_get_iban(session):
-    """Creates consent and extracts the working IBAN (target_account_id)."""
-    print("1. Creating Consent...")
-    session.headers.update({"X-Request-ID": generate_request_id('1')})
-    
-    consent_payload = {
-        "access": ["accounts", "balances", "transactions", "confirmationOfFunds"],
-        "recurringIndicator": True,
-        "validUntil": (datetime.now() + timedelta(days=90)).strftime('%Y-%m-%d'),
-        "frequencyPerDay": 4
-    }
-    
-    resp = session.post(f"{BASE_URL}/consents", json=consent_payload)
-    resp.raise_for_status()
-    consent_id = resp.json().get("consentId")
-    session.headers.update({"Consent-ID": consent_id})
-    print(f"✅ Consent ID: {consent_id}")
-
-    print(f"\n2. Finding Working IBAN via Consent Status Check...")
-    session.headers.update({"X-Request-ID": generate_request_id('2')}) 
-    resp = session.get(f"{BASE_URL}/consents/{consent_id}")
-    resp.raise_for_status()
-    
-    target_account_list = resp.json().get("access", {}).get("transactions", [])
-    if not target_account_list:
-        raise ValueError("CRITICAL FAILURE: Cannot find a working IBAN.")
-        
-    target_account_id = target_account_list[0]
-    print(f"✅ Success! Discovered Target IBAN: {target_account_id}")
-    return target_account_id
+async def cleanup_account(vpbank: VPBank, sem: asyncio.Semaphore, account_id: str):
+    """Count → delete → recount one account; runs under the shared semaphore."""
+    async with sem:
+        count_before = await vpbank.get_transaction_count(account_id)
+        if count_before != -1:
+            print(f"[{account_id}] Transaction Count BEFORE Deletion: {count_before}")
 
-def get_transaction_count(session, account_id):
-    """Fetches and counts current transactions."""
-    session.headers.update({"X-Request-ID": generate_request_id('9')})
-    date_from = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
-    date_to = datetime.now().strftime('%Y-%m-%d')
-    params = {"dateFrom": date_from, "dateTo": date_to, "bookingStatus": "all"}
-    url = f"{BASE_URL}/accounts/{account_id}/transactions"
-    
-    try:
-        resp = session.get(url, params=params)
-        resp.raise_for_status()
-        tx_data = resp.json()
-        count = len(tx_data.get("booked", [])) + len(tx_data.get("pending", []))
-        return count
-    except requests.exceptions.HTTPError as e:
-        print(f"Warning: Could not fetch transaction count before deletion: {e}")
-        return -1
+        if not await vpbank.delete_all_transactions(account_id):
+            return
 
-# --- SANDBOX DELETE FUNCTION ---
+        await asyncio.sleep(2)  # Wait for sandbox update
 
-def delete_all_transactions(session, account_id):
-    """
-    Attempts to delete ALL transactions for the given mock account using 
-    a non-standard sandbox cleanup endpoint.
-    """
-    print(f"\n3. Attempting to DELETE ALL transactions for {account_id}...")
-    
-    # This is a common pattern for sandbox cleanup. 
-    # It is highly likely this specific endpoint will return 404/403 
-    # if VPBank did not implement it.
-    delete_url = f"{BASE_URL}/sandbox/accounts/{account_id}/transactions"
-    
-    # We must use a separate, non-AISP X-Request-ID for this call
-    session.headers.update({"X-Request-ID": generate_request_id('5')}) 
-    # NOTE: We must NOT send the Consent-ID header for this non-standard call.
-    if "Consent-ID" in session.headers:
-        del session.headers["Consent-ID"]
+        count_after = await vpbank.get_transaction_count(account_id)
+        if count_after != -1:
+            print(f"[{account_id}] Transaction Count AFTER Deletion: {count_after}")
+            if count_after < count_before:
+                print(f"[{account_id}] 🎉 Sandbox cleanup confirmed: count reduced!")
+            else:
+                print(f"[{account_id}] ⚠️ Cleanup inconclusive: count did not change.")
 
-    try:
-        resp = session.delete(delete_url)
-        
-        if resp.status_code == 200 or resp.status_code == 204:
-            print(f"✅ SUCCESS! Sandbox cleanup request accepted (Status: {resp.status_code}).")
-            return True
-        elif resp.status_code == 404:
-            print(f"❌ FAILED (Status: 404 Not Found). The sandbox does not use the expected cleanup endpoint: {delete_url}")
-            return False
-        else:
-            resp.raise_for_status()
-            
-    except requests.exceptions.HTTPError as e:
-        print(f"❌ FAILED to delete transactions: {e}")
-        print("Response Body:", resp.text)
-        return False
 
 # --- Main Flow ---
-def main():
-    session = requests.Session()
-    session.headers.update({
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "TPP-Redirect-URI": "https://www.google.ch",
-        "PSU-IP-Address": "192.0.0.12"
-    })
+async def main():
+    """Sandbox cleanup sweep: wipe transactions for every consented account.
 
-    try:
-        # Get the working IBAN first
-        target_account_id = create_consent_and_get_iban(session)
-        
-        # Check transaction count BEFORE deletion
-        count_before = get_transaction_count(session, target_account_id)
-        if count_before != -1:
-            print(f"Current Transaction Count BEFORE Deletion: {count_before}")
-
-        # Attempt Deletion
-        if delete_all_transactions(session, target_account_id):
-            time.sleep(2) # Wait for sandbox update
-
-            # Check transaction count AFTER deletion
-            # Note: We must recreate consent headers for this check
-            target_account_id = create_consent_and_get_iban(session) 
-            count_after = get_transaction_count(session, target_account_id)
-            if count_after != -1:
-                 print(f"\nTransaction Count AFTER Deletion: {count_after}")
-                 if count_after < count_before:
-                     print("🎉 Sandbox cleanup confirmed: Transaction count reduced!")
-                 else:
-                     print("⚠️ Cleanup inconclusive: Transaction count did not change.")
+    One pooled httpx.AsyncClient (HTTP/2, keep-alive) serves the whole
+    run; per-account pipelines fan out with asyncio.gather under a
+    semaphore, so total wall time scales with the slowest account rather
+    than the sum of all round-trips.
+    """
+    async with httpx.AsyncClient(
+        # Shared retry transport: HTTP/2, pooling, and backoff on 429/5xx
+        transport=build_bank_transport(),
+        timeout=30.0,
+        headers={
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "TPP-Redirect-URI": "https://www.google.ch",
+            "PSU-IP-Address": "192.0.0.12"
+        }
+    ) as session:
+        vpbank = VPBank(session)
+
+        try:
+            # One consent covers every accessible account
+            account_ids = await vpbank.create_consent_and_list_ibans()
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"\nFATAL ERROR: {e}")
+            return
+
+        sem = asyncio.Semaphore(MAX_CONCURRENT_CLEANUPS)
+        results = await asyncio.gather(
+            *(cleanup_account(vpbank, sem, account_id) for account_id in account_ids),
+            return_exceptions=True
+        )
+        for account_id, result in zip(account_ids, results):
+            if isinstance(result, BaseException):
+                print(f"[{account_id}] FAILED: {result}")
 
-    except requests.exceptions.RequestException as e:
-        print(f"\nFATAL ERROR: A critical request error occurred: {e}")
-    except ValueError as e:
-        print(f"\nFATAL ERROR: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
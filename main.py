@@ -1,27 +1,102 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
-from app.api.auth import router as auth_router
-from app.api.google_auth import router as google_auth_router
-from app.api.health import router as health_router
-from app.api.bank_accounts import router as bank_accounts_router
 from app.handlers.exception_handlers import set_up_exception_handler
-
-# from app.api.users.routes import router as users_router
 from app.middlewares.cors_middleware import setup_cors
 
-app = FastAPI(title="VinaTien Backend Service", version="1.0.0")
 
-setup_cors(app)
-set_up_exception_handler(app)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Imported here with the routers so the module import stays light;
+    # everything heavy loads once inside create_app().
+    from app.adapters.oauth.google_oauth_adapter import warm_google_certs
+    from app.bank.client import close_bank_client
+    from app.services import revocation_cache_service
+
+    # Warm the Google signing-cert cache off the event loop so the first
+    # OAuth login after deploy skips the cert fetch.
+    await asyncio.to_thread(warm_google_certs)
+
+    # Seed the in-memory revoked-token set before serving traffic, then keep
+    # it fresh (and the table trimmed) with background tasks.
+    try:
+        await revocation_cache_service.refresh_revoked_set()
+    except Exception:
+        pass  # DB may lag app startup; the refresh loop retries shortly.
+    background_tasks = [
+        asyncio.create_task(revocation_cache_service.revoked_set_refresh_loop()),
+        asyncio.create_task(revocation_cache_service.expired_token_cleanup_loop()),
+    ]
+    yield
+    for task in background_tasks:
+        task.cancel()
+    await close_bank_client()
+
+
+def create_app() -> FastAPI:
+    """Build the application; router imports live here so importing main
+    (e.g. from Alembic env or tooling) doesn't pull in every model,
+    schema, and third-party client."""
+    # orjson serializes responses several times faster than stdlib json,
+    # which matters most for large transaction lists.
+    app = FastAPI(
+        title="VinaTien Backend Service",
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+
+    setup_cors(app)
+    set_up_exception_handler(app)
+
+    @app.get("/", tags=["Root"])
+    async def welcome_root():
+        return {"message": "Welcome to the VinaTien Backend Service!!!"}
+
+    from app.api.auth import router as auth_router
+    from app.api.bank_accounts import router as bank_accounts_router
+    from app.api.google_auth import router as google_auth_router
+    from app.api.health import router as health_router
+    # from app.api.users.routes import router as users_router
+
+    app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
+    app.include_router(google_auth_router, prefix="/api/auth/google", tags=["Google OAuth"])
+    app.include_router(health_router, prefix="/api/health", tags=["Health"])
+    app.include_router(bank_accounts_router, prefix="/api/bank-accounts", tags=["Bank Accounts"])
+    # app.include_router(users_router, prefix="/api/users", tags=["Users"])
+
+    # Generate the OpenAPI schema now that all routers are mounted;
+    # app.openapi() caches into app.openapi_schema, so the first
+    # /openapi.json or /docs hit serves the precomputed result instead of
+    # walking every route and Pydantic model on request time.
+    app.openapi()
+
+    return app
+
+
+app = create_app()
 
 
-@app.get("/", tags=["Root"])
-async def welcome_root():
-    return {"message": "Welcome to the VinaTien Backend Service!!!"}
+if __name__ == "__main__":
+    import os
 
+    import uvicorn
 
-app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(google_auth_router, prefix="/api/auth/google", tags=["Google OAuth"])
-app.include_router(health_router, prefix="/api/health", tags=["Health"])
-app.include_router(bank_accounts_router, prefix="/api/bank-accounts", tags=["Bank Accounts"])
-# app.include_router(users_router, prefix="/api/users", tags=["Users"])
+    # 2n+1 workers saturates the cores instead of uvicorn's default single
+    # worker; uvloop + httptools replace the stdlib event loop and HTTP
+    # parser with C implementations. backlog/limit_concurrency bound queue
+    # growth under load spikes. Note: the in-memory caches and the sync
+    # limiter are per worker; cross-worker correctness stays with the DB.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", 8000)),
+        workers=int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1)),
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+        limit_concurrency=1000,
+    )
@@ -0,0 +1,41 @@
+"""make transaction list index covering
+
+Revision ID: a9d5c3e8f120
+Revises: f7b31d9c0a84
+Create Date: 2026-08-30 15:51:26.708442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d5c3e8f120'
+down_revision: Union[str, Sequence[str], None] = 'f7b31d9c0a84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rebuild the list index with INCLUDE payload columns: dashboard-style
+    # scans that only need amount/status/currency per account+date become
+    # index-only scans with no heap visits. Extending the existing index
+    # avoids a second overlapping (bank_account_id, booking_date) B-tree.
+    op.execute("DROP INDEX ix_tx_bank_acct_booking_date")
+    op.execute(
+        "CREATE INDEX ix_tx_bank_acct_booking_date ON transactions "
+        "(bank_account_id, booking_date DESC, id DESC) "
+        "INCLUDE (amount_minor, booking_status, currency)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX ix_tx_bank_acct_booking_date")
+    op.execute(
+        "CREATE INDEX ix_tx_bank_acct_booking_date ON transactions "
+        "(bank_account_id, booking_date DESC, id DESC)"
+    )
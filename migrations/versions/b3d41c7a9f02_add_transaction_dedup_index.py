@@ -0,0 +1,37 @@
+"""add transaction dedup index
+
+Revision ID: b3d41c7a9f02
+Revises: 05ddb85711c3
+Create Date: 2026-08-30 10:12:03.118452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d41c7a9f02'
+down_revision: Union[str, Sequence[str], None] = '05ddb85711c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_tx_dedup',
+        'transactions',
+        ['bank_account_id', 'booking_date', 'amount', 'creditor_account_last4', 'debtor_account_last4'],
+        unique=True,
+        # The last4 columns are nullable; under default NULLS DISTINCT
+        # semantics NULL never collides with NULL, so transactions without
+        # counterparty IBANs would be re-inserted on every sync. PG15+.
+        postgresql_nulls_not_distinct=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tx_dedup', table_name='transactions')
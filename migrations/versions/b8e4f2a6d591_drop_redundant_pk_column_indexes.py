@@ -0,0 +1,37 @@
+"""drop redundant pk column indexes
+
+Revision ID: b8e4f2a6d591
+Revises: a9d5c3e8f120
+Create Date: 2026-08-30 16:08:55.162309
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4f2a6d591'
+down_revision: Union[str, Sequence[str], None] = 'a9d5c3e8f120'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Postgres already maintains a unique index for every primary key
+    # (transactions' PK leads with id, covering id-only lookups too), so
+    # these secondary id indexes only add write amplification and bloat.
+    op.drop_index(op.f('ix_accounts_id'), table_name='accounts')
+    op.drop_index(op.f('ix_bank_accounts_id'), table_name='bank_accounts')
+    op.drop_index(op.f('ix_revoked_tokens_id'), table_name='revoked_tokens')
+    op.drop_index(op.f('ix_transactions_id'), table_name='transactions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_transactions_id'), 'transactions', ['id'], unique=False)
+    op.create_index(op.f('ix_revoked_tokens_id'), 'revoked_tokens', ['id'], unique=False)
+    op.create_index(op.f('ix_bank_accounts_id'), 'bank_accounts', ['id'], unique=False)
+    op.create_index(op.f('ix_accounts_id'), 'accounts', ['id'], unique=False)
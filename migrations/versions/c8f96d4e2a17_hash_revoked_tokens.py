@@ -0,0 +1,56 @@
+"""hash revoked tokens
+
+Revision ID: c8f96d4e2a17
+Revises: b3d41c7a9f02
+Create Date: 2026-08-30 14:37:55.204816
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f96d4e2a17'
+down_revision: Union[str, Sequence[str], None] = 'b3d41c7a9f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'revoked_tokens',
+        sa.Column('token_hash', sa.LargeBinary(length=16), nullable=True),
+    )
+
+    # Backfill in Python: Postgres has no built-in blake2b.
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, token FROM revoked_tokens")).fetchall()
+    for row_id, token in rows:
+        digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        conn.execute(
+            sa.text("UPDATE revoked_tokens SET token_hash = :h WHERE id = :i"),
+            {"h": digest, "i": row_id},
+        )
+
+    op.alter_column('revoked_tokens', 'token_hash', nullable=False)
+    op.create_index(
+        op.f('ix_revoked_tokens_token_hash'),
+        'revoked_tokens',
+        ['token_hash'],
+        unique=True,
+    )
+    # Lookups now go through the hash; the wide index on the raw JWT is dead.
+    op.drop_index(op.f('ix_revoked_tokens_token'), table_name='revoked_tokens')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f('ix_revoked_tokens_token'), 'revoked_tokens', ['token'], unique=True
+    )
+    op.drop_index(op.f('ix_revoked_tokens_token_hash'), table_name='revoked_tokens')
+    op.drop_column('revoked_tokens', 'token_hash')
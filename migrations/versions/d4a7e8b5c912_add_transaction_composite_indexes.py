@@ -0,0 +1,45 @@
+"""add transaction composite indexes
+
+Revision ID: d4a7e8b5c912
+Revises: c8f96d4e2a17
+Create Date: 2026-08-30 14:37:41.902217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e8b5c912'
+down_revision: Union[str, Sequence[str], None] = 'c8f96d4e2a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Matches the list query's exact shape (WHERE bank_account_id = ...
+    # ORDER BY booking_date DESC, id DESC LIMIT n), so pages come straight
+    # off one index range scan instead of a bitmap-AND plus sort.
+    op.create_index(
+        'ix_tx_bank_acct_booking_date',
+        'transactions',
+        ['bank_account_id', sa.text('booking_date DESC'), sa.text('id DESC')],
+    )
+    op.create_index(
+        'ix_tx_bank_acct_status',
+        'transactions',
+        ['bank_account_id', 'booking_status'],
+    )
+    # Redundant: every composite above (and ix_tx_dedup) leads with
+    # bank_account_id, so the single-column index only costs write time.
+    op.drop_index(op.f('ix_transactions_bank_account_id'), table_name='transactions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_transactions_bank_account_id'), 'transactions', ['bank_account_id'], unique=False)
+    op.drop_index('ix_tx_bank_acct_status', table_name='transactions')
+    op.drop_index('ix_tx_bank_acct_booking_date', table_name='transactions')
@@ -0,0 +1,39 @@
+"""store amounts as bigint minor units
+
+Revision ID: e1c29f7a4b63
+Revises: d4a7e8b5c912
+Create Date: 2026-08-30 15:02:18.447165
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1c29f7a4b63'
+down_revision: Union[str, Sequence[str], None] = 'd4a7e8b5c912'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # NUMERIC(15,2) decodes to decimal.Decimal per row; BIGINT minor units
+    # (cents) decode to plain int and compare/aggregate without allocations.
+    # The USING clause converts existing rows in the same statement.
+    op.execute(
+        "ALTER TABLE transactions "
+        "ALTER COLUMN amount TYPE bigint USING (amount * 100)::bigint"
+    )
+    op.alter_column('transactions', 'amount', new_column_name='amount_minor')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('transactions', 'amount_minor', new_column_name='amount')
+    op.execute(
+        "ALTER TABLE transactions "
+        "ALTER COLUMN amount TYPE numeric(15, 2) USING (amount::numeric / 100)"
+    )
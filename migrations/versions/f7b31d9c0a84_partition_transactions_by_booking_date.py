@@ -0,0 +1,139 @@
+"""partition transactions by booking_date
+
+Revision ID: f7b31d9c0a84
+Revises: e1c29f7a4b63
+Create Date: 2026-08-30 15:24:09.331784
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b31d9c0a84'
+down_revision: Union[str, Sequence[str], None] = 'e1c29f7a4b63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    "id, bank_account_id, booking_date, value_date, amount_minor, currency, "
+    "creditor_name, debtor_name, creditor_account_last4, debtor_account_last4, "
+    "booking_status, created_at"
+)
+
+# Monthly partitions pre-created for this window; out-of-range rows land in
+# the DEFAULT partition until an ops job creates the next months.
+_FIRST_MONTH = (2025, 1)
+_LAST_MONTH = (2026, 12)
+
+
+def _months():
+    year, month = _FIRST_MONTH
+    while (year, month) <= _LAST_MONTH:
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        yield year, month, next_year, next_month
+        year, month = next_year, next_month
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("ALTER TABLE transactions RENAME TO transactions_unpartitioned")
+
+    # Range partitioning on booking_date: date-scoped queries (the normal
+    # case) touch one or two small partitions, and old months can be
+    # dropped in O(1). The partition key must be part of the primary key.
+    op.execute("""
+        CREATE TABLE transactions (
+            id integer NOT NULL DEFAULT nextval('transactions_id_seq'),
+            bank_account_id integer NOT NULL REFERENCES bank_accounts(id) ON DELETE CASCADE,
+            booking_date timestamptz NOT NULL,
+            value_date timestamptz,
+            amount_minor bigint NOT NULL,
+            currency varchar(3) NOT NULL,
+            creditor_name varchar(255),
+            debtor_name varchar(255),
+            creditor_account_last4 varchar(4),
+            debtor_account_last4 varchar(4),
+            booking_status varchar(50) NOT NULL,
+            created_at timestamptz DEFAULT now(),
+            PRIMARY KEY (id, booking_date)
+        ) PARTITION BY RANGE (booking_date)
+    """)
+    for year, month, next_year, next_month in _months():
+        op.execute(
+            f"CREATE TABLE transactions_{year}_{month:02d} PARTITION OF transactions "
+            f"FOR VALUES FROM ('{year}-{month:02d}-01') TO ('{next_year}-{next_month:02d}-01')"
+        )
+    op.execute("CREATE TABLE transactions_default PARTITION OF transactions DEFAULT")
+
+    op.execute(
+        f"INSERT INTO transactions ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM transactions_unpartitioned"
+    )
+
+    # Keep the id sequence alive when the old table goes away
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    op.execute("DROP TABLE transactions_unpartitioned")
+
+    # Recreate the indexes on the partitioned parent (names freed by the
+    # drop above); Postgres maintains them per partition.
+    op.execute(
+        "CREATE UNIQUE INDEX ix_tx_dedup ON transactions "
+        "(bank_account_id, booking_date, amount_minor, creditor_account_last4, debtor_account_last4) "
+        "NULLS NOT DISTINCT"
+    )
+    op.execute(
+        "CREATE INDEX ix_tx_bank_acct_booking_date ON transactions "
+        "(bank_account_id, booking_date DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_tx_bank_acct_status ON transactions "
+        "(bank_account_id, booking_status)"
+    )
+    op.execute("CREATE INDEX ix_transactions_booking_date ON transactions (booking_date)")
+    op.execute("CREATE INDEX ix_transactions_id ON transactions (id)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE transactions RENAME TO transactions_partitioned")
+    op.execute("""
+        CREATE TABLE transactions (
+            id integer NOT NULL DEFAULT nextval('transactions_id_seq'),
+            bank_account_id integer NOT NULL REFERENCES bank_accounts(id) ON DELETE CASCADE,
+            booking_date timestamptz NOT NULL,
+            value_date timestamptz,
+            amount_minor bigint NOT NULL,
+            currency varchar(3) NOT NULL,
+            creditor_name varchar(255),
+            debtor_name varchar(255),
+            creditor_account_last4 varchar(4),
+            debtor_account_last4 varchar(4),
+            booking_status varchar(50) NOT NULL,
+            created_at timestamptz DEFAULT now(),
+            PRIMARY KEY (id)
+        )
+    """)
+    op.execute(
+        f"INSERT INTO transactions ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM transactions_partitioned"
+    )
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    op.execute("DROP TABLE transactions_partitioned")
+    op.execute(
+        "CREATE UNIQUE INDEX ix_tx_dedup ON transactions "
+        "(bank_account_id, booking_date, amount_minor, creditor_account_last4, debtor_account_last4) "
+        "NULLS NOT DISTINCT"
+    )
+    op.execute(
+        "CREATE INDEX ix_tx_bank_acct_booking_date ON transactions "
+        "(bank_account_id, booking_date DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX ix_tx_bank_acct_status ON transactions "
+        "(bank_account_id, booking_status)"
+    )
+    op.execute("CREATE INDEX ix_transactions_booking_date ON transactions (booking_date)")
+    op.execute("CREATE INDEX ix_transactions_id ON transactions (id)")
@@ -7,8 +7,12 @@ from models.base_model import Base
 
 class Account(Base):
     __tablename__ = "accounts"
+    # Fetch server defaults (created_at, etc.) via the INSERT's RETURNING
+    # so no post-commit refresh is needed.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    # The PK's own unique index covers id lookups; no secondary index needed.
+    id = Column(Integer, primary_key=True)
     username = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(255), unique=True, index=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
@@ -5,8 +5,12 @@ from models.base_model import Base
 
 class BankAccount(Base):
     __tablename__ = "bank_accounts"
+    # Fetch server defaults (created_at, etc.) via the INSERT's RETURNING
+    # so no post-commit refresh is needed.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    # The PK's own unique index covers id lookups; no secondary index needed.
+    id = Column(Integer, primary_key=True)
     account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False, index=True)
     bank_provider = Column(String, nullable=False)
     consent_id = Column(String(255), nullable=False, unique=True, index=True)
@@ -1,7 +1,6 @@
 """Revoked tokens model for token blacklisting."""
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Boolean, Column, DateTime, Integer, LargeBinary, String, Text
 from sqlalchemy.sql import func
 from models.base_model import Base
 
@@ -9,9 +8,16 @@ from models.base_model import Base
 class RevokedToken(Base):
     """Model for tracking revoked tokens."""
     __tablename__ = "revoked_tokens"
+    # Fetch server defaults (created_at, etc.) via the INSERT's RETURNING
+    # so no post-commit refresh is needed.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    token = Column(Text, unique=True, index=True, nullable=False)
+    # The PK's own unique index covers id lookups; no secondary index needed.
+    id = Column(Integer, primary_key=True)
+    # Full JWT kept for audit; lookups go through the 16-byte blake2b hash,
+    # whose index is ~30-90x smaller than one on the raw token.
+    token = Column(Text, nullable=False)
+    token_hash = Column(LargeBinary(16), unique=True, index=True, nullable=False)
     user_id = Column(Integer, nullable=False, index=True)
     token_type = Column(String(50), nullable=False)  # 'access', 'refresh'
     expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,4 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, UniqueConstraint
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, Column, Index, Integer, String, DateTime, ForeignKey, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from models.base_model import Base
@@ -6,19 +9,29 @@ from models.base_model import Base
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    # Fetch server defaults (created_at, etc.) via the INSERT's RETURNING
+    # so no post-commit refresh is needed.
+    __mapper_args__ = {"eager_defaults": True}
 
     # --- Primary Key and Foreign Key ---
-    id = Column(Integer, primary_key=True, index=True)
-    bank_account_id = Column(Integer, ForeignKey("bank_accounts.id", ondelete="CASCADE"), nullable=False, index=True)
+    # The PK's own unique index covers id lookups; no secondary index needed.
+    id = Column(Integer, primary_key=True)
+    # No single-column index: the composite indexes below all lead with
+    # bank_account_id, which covers lookups on it alone.
+    bank_account_id = Column(Integer, ForeignKey("bank_accounts.id", ondelete="CASCADE"), nullable=False)
 
     # --- Fields directly from tx_data ---
     
     # Dates
-    booking_date = Column(DateTime(timezone=True), nullable=False, index=True) # Source: 'bookingDate'
+    # Part of the primary key: the table is range-partitioned on
+    # booking_date and Postgres requires the partition key in the PK.
+    booking_date = Column(DateTime(timezone=True), primary_key=True, nullable=False) # Source: 'bookingDate'
     value_date = Column(DateTime(timezone=True), nullable=True)               # Source: 'valueDate'
 
     # Amount & Currency
-    amount = Column(Numeric(15, 2), nullable=False)                          # Source: 'transactionAmount.amount'
+    # Stored as integer minor units (cents): BIGINT decodes and compares as
+    # a plain int instead of allocating a Decimal per row.
+    amount_minor = Column(BigInteger, nullable=False)                        # Source: 'transactionAmount.amount' * 100
     currency = Column(String(3), nullable=False)                             # Source: 'transactionAmount.currency'
 
     # Counterparty Details (using the source names directly)
@@ -35,3 +48,53 @@ class Transaction(Base):
     # --- Audit & Relationships ---
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     bank_account = relationship("BankAccount", back_populates="transactions")
+
+    @hybrid_property
+    def amount(self) -> Decimal:
+        """Major-unit amount for the API boundary; storage stays integer."""
+        return Decimal(self.amount_minor).scaleb(-2)
+
+    @amount.inplace.expression
+    @classmethod
+    def _amount_expression(cls):
+        return cls.amount_minor / 100.0
+
+    __table_args__ = (
+        # Matches the exact predicate of transaction_exists_by_details, so the
+        # per-transaction dedup probe during sync is an index lookup. The
+        # last4 columns are nullable; NULLS NOT DISTINCT (PG15+) makes NULL
+        # collide with NULL so rows without counterparty IBANs still dedup.
+        Index(
+            "ix_tx_dedup",
+            "bank_account_id",
+            "booking_date",
+            "amount_minor",
+            "creditor_account_last4",
+            "debtor_account_last4",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        # Matches the paginated list query's WHERE + ORDER BY exactly, so
+        # a page is one index range scan with no sort step; the INCLUDE
+        # payload lets amount/status/currency scans run index-only.
+        Index(
+            "ix_tx_bank_acct_booking_date",
+            "bank_account_id",
+            text("booking_date DESC"),
+            text("id DESC"),
+            postgresql_include=["amount_minor", "booking_status", "currency"],
+        ),
+        Index("ix_tx_bank_acct_status", "bank_account_id", "booking_status"),
+        # BRIN: booking_date is near-monotonic under append-only ingest, so
+        # a block-range summary serves global date scans at a fraction of
+        # a B-tree's size and per-insert maintenance cost.
+        Index(
+            "ix_transactions_booking_date_brin",
+            "booking_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Monthly range partitions; see the partitioning migration for the
+        # partition DDL and the default partition.
+        {"postgresql_partition_by": "RANGE (booking_date)"},
+    )